@@ -11,14 +11,18 @@ st.title("📊 Credit Risk Dashboard")
 
 st.markdown("""
 Welcome! This dashboard provides an **end-to-end view of loan applicants, risk segmentation, and financial health**.  
-It is organized into 5 pages, each focusing on a different aspect of portfolio risk and applicant characteristics.
+It is organized into 9 pages, each focusing on a different aspect of portfolio risk and applicant characteristics.
 
 ### 🔎 Navigation
 - **Page 1 — Overview & Data Quality**  
 - **Page 2 — Target & Risk Segmentation**  
 - **Page 3 — Demographics & Household Profile**  
 - **Page 4 — Financial Health & Affordability**  
-- **Page 5 — Correlations & Drivers**
+- **Page 5 — Correlations & Drivers**  
+- **Page 6 — Model Scores & Risk Bands**  
+- **Page 7 — Portfolio Monitoring (Vintages)**  
+- **Page 8 — Stress Testing**  
+- **Page 9 — Applicant Drill-down**
 
 ---
 """)
@@ -0,0 +1,54 @@
+"""Applicant lookup latency vs portfolio size: DataFrame filter vs memory-mapped store.
+
+Run from DashBord_1/:  python -m benchmarks.bench_lookup [max_rows]
+"""
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.applicant_store import ApplicantStore, write_store
+
+
+def make_frame(n_rows, n_num=60, n_cat=12, seed=42):
+    rng = np.random.default_rng(seed)
+    data = {"SK_ID_CURR": rng.permutation(n_rows) + 100_000}
+    data.update({f"NUM_{i}": rng.lognormal(10, 1, n_rows) for i in range(n_num)})
+    levels = np.array([f"level_{k}" for k in range(8)], dtype=object)
+    data.update({f"CAT_{i}": levels[rng.integers(0, 8, n_rows)] for i in range(n_cat)})
+    data.update({"AMT_INCOME_TOTAL": rng.lognormal(12, 0.5, n_rows), "AMT_CREDIT": rng.lognormal(13, 0.6, n_rows)})
+    return pd.DataFrame(data)
+
+
+def median_latency(fn, repeats=50):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000
+
+
+def main(max_rows=1_000_000):
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>10}  {'filter (ms)':>12}  {'store (ms)':>11}")
+    for n_rows in [10_000, 100_000, max_rows]:
+        df = make_frame(n_rows)
+        with tempfile.TemporaryDirectory() as store_dir:
+            write_store(df, store_dir)
+            store = ApplicantStore(store_dir)
+            store.fetch([])  # map the column files once, as the cached page does
+            ids = df["SK_ID_CURR"].to_numpy()[rng.integers(0, n_rows, 5)]
+
+            t_filter = median_latency(lambda: df[df["SK_ID_CURR"].isin(ids)])
+            t_store = median_latency(lambda: store.fetch(ids))
+            fetched, _ = store.fetch(ids)
+            expected = df.set_index("SK_ID_CURR").loc[ids].reset_index()
+            pd.testing.assert_frame_equal(fetched, expected, check_dtype=False)
+        print(f"{n_rows:>10,}  {t_filter:>12.3f}  {t_store:>11.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,73 @@
+"""Before/after timings for the preprocessing winsorize / merge_rare steps.
+
+Run from DashBord_1/:  python -m benchmarks.bench_transforms [n_rows]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.transforms import merge_rare_categories, winsorize_numeric
+
+
+# -------------------------
+# Notebook versions (reference semantics)
+# -------------------------
+def merge_rare(series, threshold=0.01):
+    freqs = series.value_counts(normalize=True)
+    rare = freqs[freqs < threshold].index
+    return series.replace(rare, "Other")
+
+
+def winsorize(series):
+    lower, upper = series.quantile([0.01, 0.99])
+    return np.clip(series, lower, upper)
+
+
+def make_frame(n_rows, n_num=60, n_cat=12, seed=42):
+    rng = np.random.default_rng(seed)
+    data = {f"NUM_{i}": rng.lognormal(10, 1, n_rows) for i in range(n_num // 2)}
+    data.update({f"INT_{i}": rng.integers(-20000, 0, n_rows) for i in range(n_num - n_num // 2)})
+    levels = np.array([f"level_{k}" for k in range(30)], dtype=object)
+    probs = np.r_[np.full(10, 0.095), np.full(20, 0.0025)]
+    for i in range(n_cat):
+        data[f"CAT_{i}"] = levels[rng.choice(30, n_rows, p=probs / probs.sum())]
+    return pd.DataFrame(data)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - start
+
+
+def main(n_rows=300_000):
+    df = make_frame(n_rows)
+    num_cols = df.select_dtypes(include=["int64", "float64"]).columns
+    cat_cols = df.select_dtypes(include=["object"]).columns
+
+    def before():
+        out = df.copy()
+        for col in cat_cols:
+            out[col] = merge_rare(out[col])
+        out[num_cols] = out[num_cols].apply(winsorize)
+        return out
+
+    def after():
+        out = df.copy()
+        merge_rare_categories(out, cat_cols)
+        winsorize_numeric(out, num_cols)
+        return out
+
+    old, t_old = timed(before)
+    new, t_new = timed(after)
+    pd.testing.assert_frame_equal(old, new)
+
+    print(f"rows={n_rows:,}  numeric={len(num_cols)}  categorical={len(cat_cols)}")
+    print(f"before: {t_old:.3f}s")
+    print(f"after:  {t_new:.3f}s  ({t_old / t_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
@@ -0,0 +1,103 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from utils.monitoring import load_store, sketch_drift, trend_frame
+
+st.title("📊 7.Portfolio Monitoring (Vintages)")
+
+# Reads only the per-period aggregates written by preprocessing.ipynb —
+# history is never rescanned, so this page stays fast as vintages pile up.
+store = load_store()
+if not store["periods"]:
+    st.warning("No monitoring aggregates yet — run the monitoring step in preprocessing.ipynb.")
+    st.stop()
+
+# -------------------------
+# Sidebar
+# -------------------------
+st.sidebar.header("Monitoring Options")
+n_periods = len(store["periods"])
+window = st.sidebar.slider("Rolling window (periods)", 1, max(n_periods, 2), 1)
+trend = trend_frame(store, window=window)
+
+# -------------------------
+# KPIs (latest vs previous period, with delta)
+# -------------------------
+latest = trend.iloc[-1]
+previous = trend.iloc[-2] if len(trend) > 1 else latest
+
+def kpi(col, name, fmt):
+    value = latest.get(name, np.nan)
+    delta = value - previous.get(name, np.nan)
+    col.metric(name, fmt.format(value), None if len(trend) < 2 else fmt.format(delta))
+
+st.subheader(f"🔑 Latest Period: {trend.index[-1]}")
+col1, col2, col3 = st.columns(3)
+kpi(col1, "Applicants", "{:,.0f}")
+kpi(col2, "Default Rate (%)", "{:.2f}")
+kpi(col3, "Avg Missing per Feature (%)", "{:.2f}")
+
+col4, col5, col6 = st.columns(3)
+kpi(col4, "Avg LTI", "{:.2f}")
+kpi(col5, "Avg DTI", "{:.3f}")
+kpi(col6, "% High Credit (>1M)", "{:.2f}")
+
+col7, col8, col9 = st.columns(3)
+kpi(col7, "Median AMT_INCOME_TOTAL", "{:,.0f}")
+kpi(col8, "Avg AMT_CREDIT", "{:,.0f}")
+kpi(col9, "Median AGE_YEARS", "{:.1f}")
+
+# -------------------------
+# Trend charts
+# -------------------------
+st.subheader("📈 Trends")
+
+def plot_trend(cols, ylabel, colors=("#1f77b4", "#ff7f0e", "#2ca02c")):
+    cols = [c for c in cols if c in trend]
+    fig, ax = plt.subplots(figsize=(10, 5))
+    for c, color in zip(cols, colors):
+        ax.plot(trend.index, trend[c], marker="o", color=color, label=c)
+    ax.set_xlabel("Period")
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    ax.tick_params(axis="x", rotation=25)
+    st.pyplot(fig)
+
+st.write("### Default Rate")
+plot_trend(["Default Rate (%)"], "Default Rate (%)")
+
+st.write("### Affordability (Avg LTI / DTI)")
+plot_trend(["Avg LTI"], "Avg LTI")
+plot_trend(["Avg DTI"], "Avg DTI", colors=("#ff7f0e",))
+
+st.write("### Missingness")
+plot_trend(["Avg Missing per Feature (%)"], "Avg Missing per Feature (%)", colors=("#2ca02c",))
+
+st.write("### Income & Credit Levels")
+plot_trend(["Median AMT_INCOME_TOTAL", "Avg AMT_INCOME_TOTAL", "Avg AMT_CREDIT"], "Amount")
+
+# -------------------------
+# Distribution drift
+# -------------------------
+st.write("### Distribution Drift vs First Period (PSI)")
+drift = pd.concat([sketch_drift(store, "AMT_INCOME_TOTAL"), sketch_drift(store, "AGE_YEARS")], axis=1)
+fig, ax = plt.subplots(figsize=(10, 5))
+drift.plot(kind="bar", ax=ax, color=["#1f77b4", "#ff7f0e"])
+ax.axhline(0.1, color="grey", linestyle="--", linewidth=1)
+ax.axhline(0.25, color="red", linestyle="--", linewidth=1)
+ax.set_xlabel("Period")
+ax.set_ylabel("PSI")
+ax.tick_params(axis="x", rotation=25)
+st.pyplot(fig)
+
+st.subheader("📋 Period Table")
+st.dataframe(trend.style.format(precision=2))
+
+st.subheader("📝 Insights")
+st.markdown("""
+- Each period stores counts, sums, sums of squares and fixed-bin histograms, so adding a vintage only touches that vintage's rows.  
+- **PSI > 0.1** signals moderate drift and **PSI > 0.25** a significant shift versus the first period.  
+- A rising default rate together with rising **LTI / DTI** points to loosening affordability standards.  
+""")
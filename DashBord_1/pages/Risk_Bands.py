@@ -0,0 +1,102 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from utils.load_data import load_scores
+from utils.scoring import BAND_EDGES, BAND_LABELS, load_model
+
+st.title("📊 6.Model Scores & Risk Bands")
+
+# Scores are precomputed by the scoring cell in preprocessing.ipynb;
+# this page never fits or scores anything itself.
+try:
+    scores = load_scores()
+    model = load_model()
+except FileNotFoundError:
+    st.warning("No scores found — run the scoring step in preprocessing.ipynb first.")
+    st.stop()
+
+# -------------------------
+# KPIs
+# -------------------------
+has_target = "TARGET" in scores
+mean_pd = scores["PD"].mean() * 100
+median_pd = scores["PD"].median() * 100
+high_risk_pct = scores["RISK_BAND"].isin(BAND_LABELS[-2:]).mean() * 100
+observed_rate = scores["TARGET"].mean() * 100 if has_target else np.nan
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Scored Applicants", f"{len(scores):,}")
+col2.metric("Mean PD (%)", f"{mean_pd:.2f}%")
+col3.metric("Median PD (%)", f"{median_pd:.2f}%")
+
+col4, col5, col6 = st.columns(3)
+if has_target:  # unlabelled scores have no observed rate
+    col4.metric("Observed Default Rate (%)", f"{observed_rate:.2f}%")
+col5.metric(f"% in Bands {BAND_LABELS[-2]}–{BAND_LABELS[-1]}", f"{high_risk_pct:.2f}%")
+col6.metric("Model Features", len(model["features"]))
+
+# -------------------------
+# Band table
+# -------------------------
+agg = {"Applicants": ("PD", "size"), "Mean PD (%)": ("PD", "mean")}
+if has_target:
+    agg["Observed Default (%)"] = ("TARGET", "mean")
+bands = scores.groupby("RISK_BAND").agg(**agg).reindex(BAND_LABELS, fill_value=0)
+bands["Share (%)"] = bands["Applicants"] / bands["Applicants"].sum() * 100
+bands["Mean PD (%)"] *= 100
+if has_target:
+    bands["Observed Default (%)"] *= 100
+
+lower = ["0"] + [f"{e:.0%}" for e in BAND_EDGES]
+upper = [f"{e:.0%}" for e in BAND_EDGES] + ["100%"]
+bands.insert(0, "PD Range", [f"{lo} – {hi}" for lo, hi in zip(lower, upper)])
+
+st.subheader("🏷️ Risk Bands")
+st.dataframe(bands.style.format(precision=2))
+
+# -------------------------
+# Charts
+# -------------------------
+st.subheader("📈 Graphs")
+
+st.write("### PD Distribution")
+fig, ax = plt.subplots(figsize=(10, 5))
+ax.hist(scores["PD"], bins=50, color="#1f77b4", alpha=1, label="PD")
+for edge in BAND_EDGES:
+    ax.axvline(edge, color="#ff7f0e", linestyle="--", linewidth=1)
+ax.set_xlabel("Probability of Default")
+ax.set_ylabel("Count")
+ax.legend()
+st.pyplot(fig)
+
+st.write("### Predicted vs Observed Default by Band")
+fig, ax = plt.subplots(figsize=(10, 5))
+idx = np.arange(len(BAND_LABELS))
+ax.bar(idx - 0.2, bands["Mean PD (%)"], width=0.4, color="#1f77b4", label="Mean PD (%)")
+if has_target:
+    ax.bar(idx + 0.2, bands["Observed Default (%)"], width=0.4, color="#ff7f0e", label="Observed Default (%)")
+ax.set_xticks(idx)
+ax.set_xticklabels(BAND_LABELS)
+ax.set_xlabel("Risk Band")
+ax.set_ylabel("Rate (%)")
+ax.legend()
+st.pyplot(fig)
+
+st.write("### Model Coefficients (standardised features)")
+coef = pd.Series(model["coef"][1:], index=model["features"]).sort_values()
+fig, ax = plt.subplots(figsize=(10, 5))
+coef.plot.barh(ax=ax, color=np.where(coef > 0, "#ff7f0e", "#1f77b4"))
+ax.set_xlabel("Log-odds per 1 SD")
+st.pyplot(fig)
+
+# -------------------------
+# Narrative
+# -------------------------
+st.subheader("📝 Insights")
+st.markdown("""
+- PD comes from a logistic model on **LTI, DTI, EMPLOYMENT_YEARS, age, log income** and their interactions.  
+- Bands should rank-order risk: observed default should rise from band **A** to **F**.  
+- Bands where observed default sits well above mean PD point to under-predicted segments worth re-modelling.  
+""")
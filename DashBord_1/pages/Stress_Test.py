@@ -0,0 +1,137 @@
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+from utils.load_data import load_segment, segment_levels, segment_version
+from utils.stress import DTI_CAP, LTI_CAP, portfolio_totals, run_scenarios, scenario_grid
+from utils.versioning import cached_artifact
+
+st.title("📊 8.Stress Testing")
+
+version = segment_version()  # results come from load_segment, so key them on its source
+STRESS_COLS = ["AMT_INCOME_TOTAL", "AMT_ANNUITY", "AMT_CREDIT",
+               "INCOME_BRACKET", "NAME_CONTRACT_TYPE", "NAME_EDUCATION_TYPE"]
+
+# -------------------------
+# Sidebar
+# -------------------------
+st.sidebar.header("Portfolio Segment")
+contract_types = st.sidebar.multiselect("Contract type", segment_levels("NAME_CONTRACT_TYPE"))
+filters = {"NAME_CONTRACT_TYPE": contract_types} if contract_types else {}
+# only the partitions of the chosen contract types, and only these columns, are read
+df = load_segment(filters, columns=STRESS_COLS)
+
+st.sidebar.header("Scenario Grid")
+income_range = st.sidebar.slider("Income shock (%)", -50, 20, (-30, 0), step=5)
+annuity_range = st.sidebar.slider("Annuity shock (%) — e.g. rate rise", 0, 60, (0, 30), step=5)
+credit_range = st.sidebar.slider("Credit shock (%)", -20, 40, (0, 10), step=5)
+steps = st.sidebar.slider("Steps per shock", 2, 20, 10)
+
+st.sidebar.header("Thresholds")
+lti_cap = st.sidebar.number_input("LTI cap", 1.0, 20.0, LTI_CAP, step=0.5)
+dti_cap = st.sidebar.number_input("DTI cap", 0.05, 1.0, DTI_CAP, step=0.05)
+segment_cols = [c for c in ["INCOME_BRACKET", "NAME_CONTRACT_TYPE", "NAME_EDUCATION_TYPE"] if c in df]
+segment_col = st.sidebar.selectbox("Segment by", segment_cols)
+
+def grid_axis(lo_hi):
+    return np.linspace(lo_hi[0], lo_hi[1], steps) / 100
+
+shocks = scenario_grid(grid_axis(income_range), grid_axis(annuity_range), grid_axis(credit_range))
+
+# All scenarios in one vectorised pass, cached per dataset version and grid
+results = cached_artifact(
+    "stress-scenarios", version,
+    lambda: run_scenarios(df["AMT_INCOME_TOTAL"], df["AMT_ANNUITY"], df["AMT_CREDIT"],
+                          df[segment_col].astype(str), shocks, lti_cap, dti_cap),
+    segment_col, sorted(contract_types), income_range, annuity_range, credit_range, steps, lti_cap, dti_cap,
+)
+totals = portfolio_totals(results)
+
+# -------------------------
+# KPIs
+# -------------------------
+base_segment = run_scenarios(df["AMT_INCOME_TOTAL"], df["AMT_ANNUITY"], df["AMT_CREDIT"],
+                             df[segment_col].astype(str), np.ones((1, 3)), lti_cap, dti_cap)
+baseline = portfolio_totals(base_segment).iloc[0]
+base_segment = base_segment.set_index("segment")
+worst = totals.loc[totals["any_breach_pct"].idxmax()]
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Scenarios Evaluated", f"{len(totals):,}")
+col2.metric("Applicants", f"{int(baseline['applicants']):,}")
+col3.metric("Segments", results["segment"].nunique())
+
+col4, col5, col6 = st.columns(3)
+col4.metric("Baseline Breach (%)", f"{baseline['any_breach_pct']:.2f}%")
+col5.metric("Worst-case Breach (%)", f"{worst['any_breach_pct']:.2f}%")
+col6.metric("Worst-case Exposure at Breach", f"{worst['exposure_at_breach']:,.0f}")
+
+col7, col8, col9 = st.columns(3)
+col7.metric("Worst-case Income Shock", f"{worst['income_shock']:+.0%}")
+col8.metric("Worst-case Annuity Shock", f"{worst['annuity_shock']:+.0%}")
+col9.metric("Worst-case Credit Shock", f"{worst['credit_shock']:+.0%}")
+
+# -------------------------
+# Charts
+# -------------------------
+st.subheader("📈 Graphs")
+
+credit_levels = np.sort(totals["credit_shock"].unique())
+credit_pick = st.select_slider("Credit shock shown in heatmap", credit_levels,
+                               value=credit_levels[-1], format_func=lambda v: f"{v:+.0%}")
+
+st.write(f"### Breach Rate (%) — LTI > {lti_cap:g} or DTI > {dti_cap:g}")
+heat = totals[np.isclose(totals["credit_shock"], credit_pick)].pivot(
+    index="income_shock", columns="annuity_shock", values="any_breach_pct")
+fig, ax = plt.subplots(figsize=(10, 6))
+im = ax.imshow(heat.to_numpy(), aspect="auto", origin="lower", cmap="Reds")
+ax.set_xticks(range(heat.shape[1]))
+ax.set_xticklabels([f"{v:+.0%}" for v in heat.columns], rotation=45)
+ax.set_yticks(range(heat.shape[0]))
+ax.set_yticklabels([f"{v:+.0%}" for v in heat.index])
+ax.set_xlabel("Annuity Shock")
+ax.set_ylabel("Income Shock")
+fig.colorbar(im, ax=ax, label="Breach (%)")
+st.pyplot(fig)
+
+st.write(f"### Breach Rate by {segment_col}: Baseline vs Worst Case")
+by_segment = results[results["scenario"] == worst["scenario"]].set_index("segment")
+fig, ax = plt.subplots(figsize=(10, 5))
+idx = np.arange(len(by_segment))
+ax.bar(idx - 0.2, base_segment["any_breach_pct"].reindex(by_segment.index), width=0.4,
+       color="#1f77b4", label="Baseline")
+ax.bar(idx + 0.2, by_segment["any_breach_pct"], width=0.4, color="#ff7f0e", label="Worst case")
+ax.set_xticks(idx)
+ax.set_xticklabels(by_segment.index, rotation=45, ha="right")
+ax.set_ylabel("Breach (%)")
+ax.legend()
+st.pyplot(fig)
+
+st.write("### LTI vs DTI Breach Rate Across Scenarios")
+fig, ax = plt.subplots(figsize=(10, 5))
+ax.scatter(totals["dti_breach_pct"], totals["lti_breach_pct"], c=totals["exposure_at_breach"],
+           cmap="viridis", s=10, alpha=0.7)
+ax.set_xlabel("DTI Breach (%)")
+ax.set_ylabel("LTI Breach (%)")
+st.pyplot(fig)
+
+# -------------------------
+# Scenario table
+# -------------------------
+st.subheader("🏷️ Top Scenarios by Exposure at Breach")
+top = totals.nlargest(20, "exposure_at_breach").drop(columns="scenario")
+st.dataframe(top.style.format({
+    "income_shock": "{:+.0%}", "annuity_shock": "{:+.0%}", "credit_shock": "{:+.0%}",
+    "applicants": "{:,.0f}", "exposure_at_breach": "{:,.0f}",
+    "lti_breach_pct": "{:.2f}", "dti_breach_pct": "{:.2f}", "any_breach_pct": "{:.2f}",
+}))
+
+# -------------------------
+# Narrative
+# -------------------------
+st.subheader("📝 Insights")
+st.markdown(f"""
+- Each scenario scales **income, annuity and credit** and re-tests the affordability caps (LTI > {lti_cap:g}, DTI > {dti_cap:g}).
+- A falling income pushes both ratios up at once, so income shocks usually dominate the breach surface.
+- Exposure at breach is the stressed credit amount of applicants failing either cap — the book most at risk under that scenario.
+""")
@@ -0,0 +1,163 @@
+"""Headless static report of the five dashboard pages.
+
+Run from DashBord_1/:
+
+    python report.py --out credit_risk_report.html [--workers N]
+
+The cleaned data is read once (through the same versioned on-disk cache as
+the dashboard), every page's KPIs and chart aggregates are computed once in
+this process with the same builders the pages use (utils/kpis.py,
+utils/charts.py), and only the small figure specs are shipped to worker
+processes that draw them in parallel. The output is one self-contained HTML
+file with the figures embedded as base64 PNGs.
+"""
+import argparse
+import base64
+import html
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.charts import (
+    correlation_figures,
+    demographic_figures,
+    draw,
+    financial_figures,
+    overview_figures,
+    target_risk_figures,
+)
+from utils.kpis import (
+    CORRELATION_KPI_FORMATS,
+    DEMOGRAPHIC_KPI_FORMATS,
+    FINANCIAL_KPI_FORMATS,
+    OVERVIEW_KPI_FORMATS,
+    TARGET_RISK_KPI_FORMATS,
+    add_affordability_columns,
+    add_demographic_columns,
+    correlation_kpis,
+    default_rate_by,
+    demographic_kpis,
+    financial_kpis,
+    format_kpis,
+    overview_kpis,
+    target_risk_kpis,
+)
+from utils.versioning import cached_artifact, dataset_version
+
+CLEANED_PATH = "application_train_cleaned.csv"
+
+
+# -------------------------
+# Pages: KPIs + figure specs
+# -------------------------
+def overview_page(df, missing_share):
+    kpis = format_kpis(OVERVIEW_KPI_FORMATS, overview_kpis(df, missing_share))
+    return kpis, overview_figures(df, missing_share)
+
+
+def target_risk_page(df, version, rate_by):
+    kpis = format_kpis(TARGET_RISK_KPI_FORMATS, target_risk_kpis(df, rate_by=rate_by))
+    return kpis, target_risk_figures(df, version, rate_by)
+
+
+def demographic_page(df, version):
+    df = add_demographic_columns(df.copy())
+    kpis = format_kpis(DEMOGRAPHIC_KPI_FORMATS, demographic_kpis(df))
+    return kpis, demographic_figures(df, version)
+
+
+def financial_page(df, version):
+    df = add_affordability_columns(df.copy())
+    kpis = format_kpis(FINANCIAL_KPI_FORMATS, financial_kpis(df))
+    return kpis, financial_figures(df, version)
+
+
+def correlation_page(df, corr_matrix, version, rate_by):
+    k = correlation_kpis(corr_matrix)
+    return format_kpis(CORRELATION_KPI_FORMATS, k), correlation_figures(lambda: df, corr_matrix, k["target_corr"],
+                                                                       version, rate_by)
+
+
+def build_report(df, version):
+    # shared aggregates: computed once, reused by several pages
+    missing_share = cached_artifact("missing-share", version, lambda: df.isnull().mean())
+    corr_matrix = cached_artifact("corr-numeric", version, df.select_dtypes(include=[np.number]).corr)
+
+    def rate_by(col):
+        return cached_artifact("default-rate-by", version, lambda: default_rate_by(df, col), col)
+
+    pages = [
+        ("1. Overview & Data Quality", *overview_page(df, missing_share)),
+        ("2. Target & Risk Segmentation", *target_risk_page(df, version, rate_by)),
+        ("3. Demographics & Household Profile", *demographic_page(df, version)),
+        ("4. Financial Health & Affordability", *financial_page(df, version)),
+        ("5. Correlations & Drivers", *correlation_page(df, corr_matrix, version, rate_by)),
+    ]
+    # evaluate every figure builder here; workers only draw
+    return [(title, kpis, [(name, build()) for name, build in figs.items()]) for title, kpis, figs in pages]
+
+
+# -------------------------
+# Rendering (worker processes)
+# -------------------------
+def render_figure(spec):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig = draw(spec)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=90, bbox_inches="tight")
+    plt.close(fig)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def write_html(pages, images, out_path, version, n_rows):
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Credit Risk Report</title>",
+        "<style>body{font-family:sans-serif;margin:2em;max-width:1100px}"
+        "table{border-collapse:collapse;margin-bottom:1em}td{border:1px solid #ddd;padding:4px 10px}"
+        "figure{margin:1.5em 0}img{max-width:100%}</style></head><body>",
+        "<h1>📊 Credit Risk Dashboard — Static Report</h1>",
+        f"<p>{n_rows:,} applicants · data version <code>{version}</code> · "
+        f"generated {pd.Timestamp.now():%Y-%m-%d %H:%M}</p>",
+    ]
+    it = iter(images)
+    for title, kpis, figs in pages:
+        parts.append(f"<h2>{html.escape(title)}</h2><table>")
+        parts += [f"<tr><td>{html.escape(str(k))}</td><td><b>{html.escape(str(v))}</b></td></tr>" for k, v in kpis]
+        parts.append("</table>")
+        for name, _ in figs:
+            parts.append(f"<figure><figcaption>{html.escape(name)}</figcaption>"
+                         f"<img src='data:image/png;base64,{next(it)}'></figure>")
+    parts.append("</body></html>")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default=CLEANED_PATH)
+    parser.add_argument("--out", default="credit_risk_report.html")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    version = dataset_version(args.data)
+    df = cached_artifact("csv-" + args.data.replace("/", "_"), version, lambda: pd.read_csv(args.data))
+    pages = build_report(df, version)
+    specs = [spec for _, _, figs in pages for _, spec in figs]
+    print(f"aggregates: {len(specs)} figures in {time.perf_counter() - start:.1f}s")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        images = list(pool.map(render_figure, specs))
+    write_html(pages, images, args.out, version, len(df))
+    print(f"wrote {args.out} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.enrichment import IdIndex
+from utils.versioning import _atomic_write
+
+STORE_DIR = "applicant_store"
+META_FILE = "store_meta.json"
+# segments an applicant is ranked within, and the metrics ranked
+SEGMENT_COLS = ["INCOME_BRACKET", "NAME_CONTRACT_TYPE", "NAME_EDUCATION_TYPE", "CODE_GENDER"]
+RANKED_COLS = ["AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "AMT_GOODS_PRICE",
+               "DTI", "LTI", "ANNUITY_TO_CREDIT", "AGE_YEARS", "EMPLOYMENT_YEARS"]
+RATIOS = {
+    "DTI": ("AMT_ANNUITY", "AMT_INCOME_TOTAL"),
+    "LTI": ("AMT_CREDIT", "AMT_INCOME_TOTAL"),
+    "ANNUITY_TO_CREDIT": ("AMT_ANNUITY", "AMT_CREDIT"),
+}
+PERCENTS = np.arange(101)
+
+
+# -------------------------
+# Derived ratios (whole table at build time, a few rows at lookup time)
+# -------------------------
+def derived_ratios(frame):
+    # always from the amounts, never the cleaned table's own DTI/LTI columns
+    # (winsorized separately): the lookup page shows the ratio it ranks
+    out = {}
+    for name, (num, den) in RATIOS.items():
+        if num in frame and den in frame:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[name] = np.asarray(frame[num], dtype="float64") / np.asarray(frame[den], dtype="float64")
+    return out
+
+
+def _column_path(store_dir, name):
+    return os.path.join(store_dir, f"{name}.npy")
+
+
+# -------------------------
+# Build (once, in preprocessing)
+# -------------------------
+def segment_quantiles(df, segment_cols=SEGMENT_COLS, ranked_cols=RANKED_COLS):
+    """{segment_col: {level: {metric: 101 percentiles}}}, plus an "ALL" portfolio entry."""
+    ratios = derived_ratios(df)
+    metrics = [c for c in ranked_cols if c in ratios or c in df]
+    block = np.column_stack([ratios[c] if c in ratios else df[c].to_numpy(dtype="float64") for c in metrics])
+    block[~np.isfinite(block)] = np.nan
+
+    def table(rows):
+        # "lower": every grid point is an observed value, so tied values
+        # (winsorized bounds, imputed medians) show up as runs of equal quantiles
+        q = np.nanquantile(block[rows], PERCENTS / 100, axis=0, method="lower")
+        return {m: q[:, j].tolist() for j, m in enumerate(metrics)}
+
+    out = {"ALL": {"ALL": table(slice(None))}}
+    for col in segment_cols:
+        if col not in df:
+            continue
+        codes, levels = pd.factorize(df[col], sort=True)
+        out[col] = {str(level): table(codes == k) for k, level in enumerate(levels)}
+    return out
+
+
+def write_store(df, store_dir=STORE_DIR, id_col="SK_ID_CURR"):
+    """Columnar copy of `df` for point lookups: one .npy per column + a sorted id index.
+
+    Columns stay in `df`'s row order; `ids.npy` holds the sorted ids and
+    `offsets.npy` the row each of them lives at. Text/categorical columns
+    are stored as int32 codes with their labels in the metadata file.
+    Ids must be the raw integer keys: unique (checked by IdIndex) and saved
+    as int64, so lookups by a real SK_ID_CURR match exactly.
+    """
+    ids = df[id_col].to_numpy()
+    if not np.array_equal(ids, np.round(ids)):
+        raise ValueError(f"{id_col} has non-integer values; build the store from the unclipped ids")
+    os.makedirs(store_dir, exist_ok=True)
+    index = IdIndex(ids.astype("int64"))
+    np.save(_column_path(store_dir, "ids"), index.sorted_ids)
+    np.save(_column_path(store_dir, "offsets"), index.order)
+
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if pd.api.types.is_numeric_dtype(values) and not isinstance(values.dtype, pd.CategoricalDtype):
+            np.save(_column_path(store_dir, col), values.to_numpy())
+            columns[col] = None
+        else:
+            codes, levels = pd.factorize(values, sort=True)
+            np.save(_column_path(store_dir, col), codes.astype("int32"))
+            columns[col] = [str(level) for level in levels]
+
+    meta = {"n_rows": len(df), "id_col": id_col, "columns": columns, "quantiles": segment_quantiles(df)}
+    path = os.path.join(store_dir, META_FILE)
+    _atomic_write(path, lambda f: json.dump(meta, f))
+    return path
+
+
+# -------------------------
+# Lookup
+# -------------------------
+class ApplicantStore:
+    """Memory-mapped applicant store; a lookup touches only the requested rows.
+
+    Finding an id is a binary search in the mapped `ids.npy` (a handful of
+    pages, whatever the portfolio size) and each column read gathers just
+    those rows from its mapped file.
+    """
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, META_FILE)) as f:
+            self.meta = json.load(f)
+        self.columns = self.meta["columns"]
+        self.quantiles = self.meta["quantiles"]
+        self.index = IdIndex.from_sorted(self._mmap("ids"), self._mmap("offsets"))
+        self._maps = {}
+
+    def _mmap(self, name):
+        return np.load(_column_path(self.store_dir, name), mmap_mode="r")
+
+    def column(self, name):
+        if name not in self._maps:
+            self._maps[name] = self._mmap(name)
+        return self._maps[name]
+
+    def fetch(self, ids, columns=None):
+        """Rows for `ids` (in request order) and the ids that were not found."""
+        ids = np.atleast_1d(np.asarray(ids, dtype="int64"))
+        rows, found = self.index.rows(ids)
+        rows = rows[found]
+        data = {}
+        for name in columns or self.columns:
+            values = self.column(name)[rows]
+            levels = self.columns[name]
+            if levels is not None:
+                labels = np.array(levels + [None], dtype=object)
+                values = labels[np.where(values < 0, len(levels), values)]
+            data[name] = values
+        return pd.DataFrame(data), ids[~found].tolist()
+
+    def percentile(self, metric, value, segment_col="ALL", level="ALL"):
+        """Percentile (0-100) of `value` among `metric` values of the segment.
+
+        A value that fills a run of equal quantiles (a winsorized bound, an
+        imputed median) gets the middle of that run, i.e. its mid-rank.
+        """
+        grid = self.quantiles.get(segment_col, {}).get(str(level), {}).get(metric)
+        if grid is None or not np.isfinite(value) or np.isnan(grid).any():
+            return np.nan
+        grid = np.asarray(grid)
+        lo, hi = np.searchsorted(grid, value, side="left"), np.searchsorted(grid, value, side="right")
+        if hi - lo > 1:
+            return float(PERCENTS[lo] + PERCENTS[hi - 1]) / 2
+        return float(np.interp(value, grid, PERCENTS))
+
+    def percentiles(self, row, segment_cols=None):
+        """DataFrame (metric x segment) of one applicant's percentiles."""
+        ratios = {k: v[0] for k, v in derived_ratios(row.to_frame().T).items()}
+        metrics = [m for m in RANKED_COLS if m in ratios or m in row]
+        out = {}
+        for col in ["ALL"] + [c for c in (self.quantiles if segment_cols is None else segment_cols) if c != "ALL"]:
+            level = "ALL" if col == "ALL" else row.get(col)
+            label = "Portfolio" if col == "ALL" else f"{col} = {level}"
+            out[label] = [self.percentile(m, float(ratios.get(m, row.get(m))), col, level) for m in metrics]
+        return pd.DataFrame(out, index=metrics)
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+from utils.versioning import cached_artifact
+
+MAX_FLIERS = 200
+
+
+# -------------------------
+# Grouped boxplot statistics (one sort, no per-group Python lists)
+# -------------------------
+def _percentile_sorted(sorted_vals, starts, counts, q):
+    # linear interpolation on each group's sorted run, same as np.percentile
+    pos = starts + q * (counts - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, starts + counts - 1)
+    frac = pos - lo
+    return sorted_vals[lo] + frac * (sorted_vals[hi] - sorted_vals[lo])
+
+
+def grouped_box_stats(values, groups, whis=1.5, max_fliers=MAX_FLIERS, labels=None):
+    """Per-group stats dicts for `ax.bxp`, matching `ax.boxplot` on raw arrays.
+
+    A single `np.lexsort` by (group code, value) lays every group out as a
+    contiguous sorted run (one sort-based pass over the column); quartiles
+    are read by index from each group's run and whiskers found with a binary search, so the
+    result (and what matplotlib has to draw) depends on the number of
+    groups, not rows. NaN values and NaN groups are dropped like
+    `groupby(...).dropna()`. At most `max_fliers` evenly spaced outliers
+    (always including the extremes) are kept per group.
+    """
+    values = np.asarray(values, dtype="float64")
+    codes, uniques = pd.factorize(pd.Series(groups), sort=True)
+    keep = (codes >= 0) & ~np.isnan(values)
+    values, codes = values[keep], codes[keep]
+
+    sorted_vals = values[np.lexsort((values, codes))]
+    counts = np.bincount(codes, minlength=len(uniques))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    present = counts > 0
+    q1 = np.full(len(uniques), np.nan)
+    med, q3, mean = q1.copy(), q1.copy(), q1.copy()
+    s, c = starts[present], counts[present]
+    q1[present] = _percentile_sorted(sorted_vals, s, c, 0.25)
+    med[present] = _percentile_sorted(sorted_vals, s, c, 0.50)
+    q3[present] = _percentile_sorted(sorted_vals, s, c, 0.75)
+    mean[present] = np.add.reduceat(sorted_vals, s) / c if len(s) else []
+
+    stats = []
+    for g, label in enumerate(uniques):
+        if not present[g]:
+            continue
+        run = sorted_vals[starts[g]:starts[g] + counts[g]]
+        iqr = q3[g] - q1[g]
+        # whiskers: furthest data point within whis * IQR of the box
+        lo_idx = np.searchsorted(run, q1[g] - whis * iqr, side="left")
+        hi_idx = np.searchsorted(run, q3[g] + whis * iqr, side="right") - 1
+        whislo = run[lo_idx] if lo_idx < len(run) and run[lo_idx] <= q1[g] else q1[g]
+        whishi = run[hi_idx] if hi_idx >= 0 and run[hi_idx] >= q3[g] else q3[g]
+
+        below = run[:np.searchsorted(run, whislo, side="left")]
+        above = run[np.searchsorted(run, whishi, side="right"):]
+        fliers = np.concatenate((below, above))
+        if len(fliers) > max_fliers:
+            fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).round().astype(np.intp)]
+
+        stats.append({
+            "label": labels[g] if labels is not None else str(label),
+            "mean": mean[g],
+            "med": med[g],
+            "q1": q1[g],
+            "q3": q3[g],
+            "iqr": iqr,
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": fliers,
+            "n": int(counts[g]),
+        })
+    return stats
+
+
+def cached_box_stats(df, y, by, version, labels=None, key=None):
+    """`grouped_box_stats` of df[y] by df[by], cached per (column, group-by).
+
+    Pass `key` when `y` is a page-local derived column so it does not share
+    a cache entry with the cleaned column of the same name. `df` may also be
+    a zero-argument loader; it is only called on a cache miss, so a warm
+    entry never reads the table.
+    """
+    def compute():
+        frame = df() if callable(df) else df
+        return grouped_box_stats(frame[y], frame[by], labels=labels)
+
+    return cached_artifact("box-stats", version, compute, key or y, by, labels)
@@ -0,0 +1,324 @@
+import numpy as np
+import pandas as pd
+
+from utils.boxstats import cached_box_stats
+from utils.kpis import target_risk_frame
+from utils.versioning import cached_artifact
+
+# Figures shared by the Streamlit pages and the headless report (report.py).
+# Each page has a builder returning {title: build}, where build() aggregates
+# the data into a small spec and draw(spec) turns it into a matplotlib
+# figure. Pages draw the one(s) they show; the report draws all of them.
+# Pure pandas/NumPy/matplotlib: nothing here imports streamlit.
+
+C1, C2, C3 = "#1f77b4", "#ff7f0e", "#2ca02c"
+FIGSIZE = (10, 5)
+REPAID_DEFAULT = ["Repaid (0)", "Default (1)"]
+# page 1 sidebar defaults
+OVERVIEW_BINS = 10
+OVERVIEW_TOP_N = 2
+OVERVIEW_TOP_K = 10
+OVERVIEW_CAT_COLS = ["CODE_GENDER", "NAME_FAMILY_STATUS", "NAME_EDUCATION_TYPE"]
+# page 5 heatmap default selection
+CORR_HEATMAP_COLS = ["TARGET", "AMT_CREDIT", "AMT_INCOME_TOTAL", "AGE_YEARS"]
+
+
+# -------------------------
+# Spec helpers (aggregation only)
+# -------------------------
+def hist(series, bins, xlabel, ylabel="Count", color=C1, label=None, **style):
+    counts, edges = np.histogram(pd.Series(series).dropna(), bins=bins)
+    return {"kind": "hist", "edges": edges, "layers": [(label, counts, color, 1)],
+            "xlabel": xlabel, "ylabel": ylabel, "legend": label is not None, **style}
+
+
+def hist_by_target(df, col, bins, xlabel, labels, ylabel="Count"):
+    # one set of edges for both groups so the overlay is comparable
+    edges = np.histogram_bin_edges(df[col].dropna(), bins=bins)
+    layers = [(label, np.histogram(df.loc[df["TARGET"] == target, col].dropna(), bins=edges)[0], color, 0.6)
+              for target, label, color in zip((0, 1), labels, (C1, C2))]
+    return {"kind": "hist", "edges": edges, "layers": layers, "xlabel": xlabel, "ylabel": ylabel, "legend": True}
+
+
+def bar(series, xlabel, ylabel, color=C1, horizontal=False, label=None, **style):
+    return {"kind": "bar", "labels": [str(i) for i in series.index], "values": series.to_numpy(dtype="float64"),
+            "color": color, "horizontal": horizontal, "label": label, "xlabel": xlabel, "ylabel": ylabel, **style}
+
+
+def box(stats, xlabel="", ylabel="", **style):
+    return {"kind": "box", "stats": stats, "xlabel": xlabel, "ylabel": ylabel, **style}
+
+
+def heatmap(corr, **style):
+    return {"kind": "heatmap", "matrix": corr.to_numpy(), "labels": list(corr.columns), **style}
+
+
+def scatter(x, y, xlabel, ylabel, color, **style):
+    return {"kind": "scatter", "x": np.asarray(x), "y": np.asarray(y), "color": color,
+            "xlabel": xlabel, "ylabel": ylabel, **style}
+
+
+# -------------------------
+# Page 1 — Overview & Data Quality
+# -------------------------
+def overview_figures(df, missing_share, bins=OVERVIEW_BINS, top_n=OVERVIEW_TOP_N, display_mode="Bar",
+                     cat_col=OVERVIEW_CAT_COLS[0], top_k=OVERVIEW_TOP_K, xlabel=None, ylabel="Count"):
+    rot = {"xrot": 25, "yrot": 25}
+
+    def target_distribution():
+        counts = df["TARGET"].value_counts().sort_index()
+        if display_mode == "Pie":
+            return {"kind": "pie", "values": counts.to_numpy(), "labels": [str(i) for i in counts.index],
+                    "colors": [C1, C2], "legend_title": "TARGET"}
+        return bar(counts, "TARGET", "Count", label="TARGET", ha="right", **rot)
+
+    def missing_values():
+        missing = (missing_share * 100).sort_values(ascending=False).head(top_n)[::-1]
+        return bar(missing, "Missing %", "Feature", horizontal=True, label="Missing %", **rot)
+
+    return {
+        "Target Distribution": target_distribution,
+        "Missing Values (Top N)": missing_values,
+        "Histogram — AGE_YEARS": lambda: hist(df["AGE_YEARS"], bins, "Age (Years)", label="Age (Years)", **rot),
+        "Histogram — AMT_INCOME_TOTAL": lambda: hist(df["AMT_INCOME_TOTAL"], bins, "Annual Income",
+                                                    label="Annual Income", **rot),
+        "Histogram — AMT_CREDIT": lambda: hist(df["AMT_CREDIT"], bins, "Credit Amount", label="Credit Amount", **rot),
+        "Bar — Categorical (CODE_GENDER / FAMILY / EDUCATION)": lambda: bar(
+            df[cat_col].fillna("MISSING").value_counts().head(top_k), xlabel or cat_col, ylabel,
+            label=xlabel or cat_col, ha="right", **rot),
+    }
+
+
+# -------------------------
+# Page 2 — Target & Risk Segmentation
+# -------------------------
+def target_risk_figures(df, version, rate_by):
+    """`rate_by(col)` returns default % per level of col (the pages pass a cached one)."""
+    work = target_risk_frame(df)
+    rot = {"xrot": 25, "ha": "right"}
+
+    def rate_bar(col, color):
+        return bar(rate_by(col).sort_values(ascending=False), col, "Default Rate (%)", color=color, **rot)
+
+    def target_box(col, ylabel, key=None):
+        return box(cached_box_stats(work, col, "TARGET", version, key=key), "TARGET", ylabel)
+
+    def contract_type():
+        counts = work.groupby(["NAME_CONTRACT_TYPE", "TARGET"]).size().unstack(fill_value=0)
+        return {"kind": "stacked", "labels": [str(i) for i in counts.index],
+                "series": [(str(c), counts[c].to_numpy()) for c in counts.columns], "colors": [C1, C2],
+                "legend_title": "TARGET", "xlabel": "NAME_CONTRACT_TYPE", "ylabel": "Count", **rot}
+
+    figs = {
+        "1) Counts: Default vs Repaid": lambda: bar(work["TARGET"].value_counts().sort_index(), "TARGET", "Count",
+                                                   color=[C1, C2], xrot=25),
+        "2) Default % by Gender": lambda: bar(rate_by("CODE_GENDER"), "CODE_GENDER", "Default Rate (%)", xrot=25),
+        "3) Default % by Education": lambda: rate_bar("NAME_EDUCATION_TYPE", C3),
+        "4) Default % by Family Status": lambda: rate_bar("NAME_FAMILY_STATUS", C2),
+        "5) Default % by Housing Type": lambda: rate_bar("NAME_HOUSING_TYPE", C1),
+        "6) Income by Target": lambda: target_box("AMT_INCOME_TOTAL", "Income"),
+        "7) Credit by Target": lambda: target_box("AMT_CREDIT", "Credit"),
+    }
+    if "AGE_YEARS" in work.columns:
+        # floored years from DAYS_BIRTH, not the cleaned AGE_YEARS column
+        figs["8) Age vs Target"] = lambda: target_box("AGE_YEARS", "Age (Years)", key="AGE_YEARS_FLOOR")
+    figs["9) Employment Years by Target"] = lambda: hist_by_target(work, "EMP_YEARS", 30, "Employment Years",
+                                                                  labels=REPAID_DEFAULT)
+    figs["10) Contract Type vs Target"] = contract_type
+    return figs
+
+
+# -------------------------
+# Page 3 — Demographics & Household Profile
+# -------------------------
+def demographic_figures(df, version):
+    """Expects the columns from `add_demographic_columns`."""
+    def housing():
+        housing = df["NAME_HOUSING_TYPE"].value_counts()
+        return {"kind": "pie", "values": housing.to_numpy(), "labels": [str(i) for i in housing.index],
+                "startangle": 90, "figsize": (8, 8)}
+
+    return {
+        "Age Distribution (All Applicants)": lambda: hist(df["AGE_YEARS"], 50, "Age (Years)", label="Age"),
+        "Age Distribution by Target": lambda: hist_by_target(df, "AGE_YEARS", 50, "Age (Years)",
+                                                             labels=("Non-Defaulters (0)", "Defaulters (1)")),
+        "Gender Distribution": lambda: bar(df["CODE_GENDER"].value_counts(), "Gender", "Count"),
+        "Family Status Distribution": lambda: bar(df["NAME_FAMILY_STATUS"].value_counts(), "Family Status", "Count",
+                                                  color=C2, xrot=25),
+        "Education Distribution": lambda: bar(df["NAME_EDUCATION_TYPE"].value_counts(), "Education Type", "Count",
+                                              color=C3, xrot=25),
+        "Occupation Distribution (Top 10)": lambda: bar(
+            df["OCCUPATION_TYPE"].fillna("MISSING").value_counts().head(10), "Occupation Type", "Count",
+            color="#9467bd", xrot=25),
+        "Housing Type Distribution": housing,
+        "Children Count Distribution": lambda: bar(df["CNT_CHILDREN"].value_counts().sort_index(),
+                                                   "Number of Children", "Count", color="#8c564b"),
+        # AGE_YEARS is re-derived (whole years), so it gets its own cache key
+        "Age vs Target": lambda: box(cached_box_stats(df, "AGE_YEARS", "TARGET", version, labels=REPAID_DEFAULT,
+                                                      key="AGE_YEARS_INT"), ylabel="Age (Years)"),
+        "Correlation Heatmap (Demographic Variables)": lambda: heatmap(
+            df[["AGE_YEARS", "CNT_CHILDREN", "CNT_FAM_MEMBERS", "TARGET"]].corr(), xrot=25, figsize=(8, 6)),
+    }
+
+
+# -------------------------
+# Page 4 — Financial Health & Affordability
+# -------------------------
+def financial_figures(df, version):
+    """Expects the columns from `add_affordability_columns`."""
+    def default_rate_by_decile():
+        brackets = pd.qcut(df["AMT_INCOME_TOTAL"], q=10, duplicates="drop")
+        return df.groupby(brackets.rename("Income_Bracket"), observed=False)["TARGET"].mean() * 100
+
+    def joint_density():
+        counts, xedges, yedges = np.histogram2d(df["AMT_INCOME_TOTAL"], df["AMT_CREDIT"], bins=50)
+        return {"kind": "hist2d", "counts": counts, "xedges": xedges, "yedges": yedges,
+                "xlabel": "Income", "ylabel": "Credit"}
+
+    def income_scatter(y, ylabel, color):
+        # every applicant is drawn (pages cache the rendered PNG)
+        return scatter(df["AMT_INCOME_TOTAL"], df[y], "Income", ylabel, color, alpha=0.3, label="Applicants",
+                       grid=True)
+
+    def target_box(col, ylabel):
+        return box(cached_box_stats(df, col, "TARGET", version, labels=REPAID_DEFAULT), ylabel=ylabel, grid=True)
+
+    fin_cols = ["AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "DTI", "LTI", "TARGET"]
+    return {
+        "Income Distribution": lambda: hist(df["AMT_INCOME_TOTAL"], 50, "Income", label="Income"),
+        "Credit Distribution": lambda: hist(df["AMT_CREDIT"], 50, "Credit", color=C2, label="Credit"),
+        "Annuity Distribution": lambda: hist(df["AMT_ANNUITY"], 50, "Annuity", color=C3, label="Annuity"),
+        "Income vs Credit": lambda: income_scatter("AMT_CREDIT", "Credit", "#3e82b3"),
+        "Income vs Annuity": lambda: income_scatter("AMT_ANNUITY", "Annuity", C2),
+        "Credit by Target": lambda: target_box("AMT_CREDIT", "Credit"),
+        "Income by Target": lambda: target_box("AMT_INCOME_TOTAL", "Income"),
+        "Joint Income–Credit (Density Approximation)": joint_density,
+        "Income Brackets vs Default Rate": lambda: bar(
+            cached_artifact("default-rate-by-income-decile", version, default_rate_by_decile),
+            "Income Bracket", "Default Rate (%)", xrot=90),
+        "Correlation Heatmap (Financial Variables)": lambda: heatmap(
+            cached_artifact("corr-financial", version, df[fin_cols].corr), xrot=45),
+    }
+
+
+# -------------------------
+# Page 5 — Correlations, Drivers & Slice-and-Dice
+# -------------------------
+def correlation_figures(load_df, corr_matrix, target_corr, version, rate_by, heatmap_cols=CORR_HEATMAP_COLS):
+    """`load_df()` returns the full table; only the row-level charts call it."""
+    rot = {"xrot": 25, "yrot": 25, "ha": "right"}
+
+    def target_scatter(x, y, hue="TARGET"):
+        df = load_df()
+        colors = {0: C1, 1: C2}
+        if hue in df:
+            return scatter(df[x], df[y], x, y, df[hue].map(colors).to_numpy(), alpha=0.7,
+                           legend_entries=[(f"{hue}={v}", c) for v, c in colors.items()], **rot)
+        return scatter(df[x], df[y], x, y, C1, alpha=0.7, label=f"{x} vs {y}", **rot)
+
+    def group_box(x, y):
+        # load_df is only called when the stats are not cached yet
+        return box(cached_box_stats(load_df, y, x, version), x, y, legend=[y], legend_loc="upper right", **rot)
+
+    def filtered_bar(group_col):
+        return bar(rate_by(group_col).sort_values(), group_col, "Default Rate (%)", label="Default Rate (%)", **rot)
+
+    figs = {
+        "Heatmap — Correlation (selected numerics)": lambda: heatmap(
+            corr_matrix.loc[heatmap_cols, heatmap_cols], colorbar_label="Correlation", axes_title="Correlation Heatmap",
+            xrot=25, yrot=25, ha="left"),
+        "Bar — |Correlation| vs TARGET": lambda: bar(target_corr.abs().sort_values(ascending=False).head(20), "", "",
+                                                    label="|Correlation| with TARGET", **rot),
+        "Scatter — Age vs Credit": lambda: target_scatter("AGE_YEARS", "AMT_CREDIT"),
+        "Scatter — Age vs Income": lambda: target_scatter("AGE_YEARS", "AMT_INCOME_TOTAL"),
+        "Scatter — Employment vs TARGET": lambda: target_scatter("DAYS_EMPLOYED", "TARGET"),
+        "Boxplot — Credit by Education": lambda: group_box("NAME_EDUCATION_TYPE", "AMT_CREDIT"),
+        "Boxplot — Income by Family Status": lambda: group_box("NAME_FAMILY_STATUS", "AMT_INCOME_TOTAL"),
+        "Filtered Bar — Default Rate by Gender": lambda: filtered_bar("CODE_GENDER"),
+        "Filtered Bar — Default Rate by Education": lambda: filtered_bar("NAME_EDUCATION_TYPE"),
+    }
+    if "DAYS_EMPLOYED" not in corr_matrix:
+        del figs["Scatter — Employment vs TARGET"]
+    return figs
+
+
+# -------------------------
+# Drawing
+# -------------------------
+def draw(spec):
+    """matplotlib Figure for a spec built above (same code path for pages and report)."""
+    import matplotlib.pyplot as plt
+
+    kind = spec["kind"]
+    fig, ax = plt.subplots(figsize=spec.get("figsize", FIGSIZE))
+    if kind == "bar":
+        idx = np.arange(len(spec["labels"]))
+        if spec["horizontal"]:
+            ax.barh(idx, spec["values"], color=spec["color"], label=spec["label"])
+            ax.set_yticks(idx)
+            ax.set_yticklabels(spec["labels"])
+        else:
+            ax.bar(idx, spec["values"], color=spec["color"], label=spec["label"])
+            ax.set_xticks(idx)
+            ax.set_xticklabels(spec["labels"])
+        if spec["label"] is not None:
+            ax.legend()
+    elif kind == "stacked":
+        idx = np.arange(len(spec["labels"]))
+        bottom = np.zeros(len(idx))
+        for (name, values), color in zip(spec["series"], spec["colors"]):
+            ax.bar(idx, values, bottom=bottom, color=color, label=name)
+            bottom += values
+        ax.set_xticks(idx)
+        ax.set_xticklabels(spec["labels"])
+        ax.legend(title=spec.get("legend_title"))
+    elif kind == "hist":
+        for label, counts, color, alpha in spec["layers"]:
+            ax.stairs(counts, spec["edges"], fill=True, color=color, alpha=alpha, label=label)
+        if spec.get("legend"):
+            ax.legend()
+    elif kind == "box":
+        ax.bxp(spec["stats"])
+        if spec.get("legend"):
+            ax.legend(spec["legend"], loc=spec.get("legend_loc"))
+    elif kind == "scatter":
+        ax.scatter(spec["x"], spec["y"], color=spec["color"], alpha=spec.get("alpha", 1), label=spec.get("label"))
+        for label, color in spec.get("legend_entries", []):
+            ax.scatter([], [], color=color, alpha=spec.get("alpha", 1), label=label)
+        if spec.get("label") or spec.get("legend_entries"):
+            ax.legend()
+    elif kind == "hist2d":
+        ax.pcolormesh(spec["xedges"], spec["yedges"], spec["counts"].T, cmap="Blues")
+    elif kind == "heatmap":
+        cax = ax.matshow(spec["matrix"], cmap="coolwarm")
+        if spec.get("colorbar_label"):
+            fig.colorbar(cax, ax=ax, fraction=0.046, pad=0.04, label=spec["colorbar_label"])
+        else:
+            fig.colorbar(cax)
+        ticks = range(len(spec["labels"]))
+        ax.set_xticks(ticks)
+        ax.set_xticklabels(spec["labels"])
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(spec["labels"])
+        if spec.get("axes_title"):
+            ax.set_title(spec["axes_title"], pad=20)
+    elif kind == "pie":
+        ax.pie(spec["values"], labels=spec["labels"], colors=spec.get("colors"), autopct="%1.1f%%",
+               startangle=spec.get("startangle", 0))
+        if spec.get("legend_title"):
+            ax.legend(spec["labels"], title=spec["legend_title"])
+
+    if kind != "pie":
+        ax.set_xlabel(spec.get("xlabel", ""))
+        ax.set_ylabel(spec.get("ylabel", ""))
+    if spec.get("xrot"):
+        for tick in ax.get_xticklabels():
+            tick.set_rotation(spec["xrot"])
+            if spec.get("ha"):
+                tick.set_ha(spec["ha"])
+    if spec.get("yrot"):
+        for tick in ax.get_yticklabels():
+            tick.set_rotation(spec["yrot"])
+    if spec.get("grid"):
+        ax.grid(True)
+    return fig
@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+CHUNKSIZE = 500_000
+
+
+# -------------------------
+# Per-applicant aggregations pushed into the scan of each child table.
+# Each feature: (name, op, column or function of the chunk); op is
+# "count" (rows where the value is true), "sum" or "max" (max starts at 0,
+# so only non-negative quantities such as overdue amounts/days are used).
+# -------------------------
+AUX_TABLES = {
+    "bureau.csv": {
+        "usecols": ["SK_ID_CURR", "CREDIT_ACTIVE", "AMT_CREDIT_SUM", "AMT_CREDIT_SUM_DEBT",
+                    "CREDIT_DAY_OVERDUE", "AMT_CREDIT_MAX_OVERDUE"],
+        "features": [
+            ("BUREAU_COUNT", "count", lambda c: np.ones(len(c), dtype=bool)),
+            ("BUREAU_ACTIVE_COUNT", "count", lambda c: (c["CREDIT_ACTIVE"] == "Active").to_numpy()),
+            ("BUREAU_CREDIT_SUM", "sum", "AMT_CREDIT_SUM"),
+            ("BUREAU_DEBT_SUM", "sum", "AMT_CREDIT_SUM_DEBT"),
+            ("BUREAU_MAX_DAYS_OVERDUE", "max", "CREDIT_DAY_OVERDUE"),
+            ("BUREAU_MAX_OVERDUE_AMT", "max", "AMT_CREDIT_MAX_OVERDUE"),
+        ],
+    },
+    "previous_application.csv": {
+        "usecols": ["SK_ID_CURR", "NAME_CONTRACT_STATUS", "AMT_CREDIT"],
+        "features": [
+            ("PREV_COUNT", "count", lambda c: np.ones(len(c), dtype=bool)),
+            ("PREV_APPROVED_COUNT", "count", lambda c: (c["NAME_CONTRACT_STATUS"] == "Approved").to_numpy()),
+            ("PREV_REFUSED_COUNT", "count", lambda c: (c["NAME_CONTRACT_STATUS"] == "Refused").to_numpy()),
+            ("PREV_CREDIT_SUM", "sum", "AMT_CREDIT"),
+        ],
+    },
+    "installments_payments.csv": {
+        "usecols": ["SK_ID_CURR", "DAYS_INSTALMENT", "DAYS_ENTRY_PAYMENT", "AMT_INSTALMENT", "AMT_PAYMENT"],
+        "features": [
+            ("INST_COUNT", "count", lambda c: np.ones(len(c), dtype=bool)),
+            ("INST_LATE_COUNT", "count", lambda c: (c["DAYS_ENTRY_PAYMENT"] > c["DAYS_INSTALMENT"]).to_numpy()),
+            ("INST_MAX_DAYS_LATE", "max", lambda c: (c["DAYS_ENTRY_PAYMENT"] - c["DAYS_INSTALMENT"]).clip(lower=0)),
+            ("INST_DUE_SUM", "sum", "AMT_INSTALMENT"),
+            ("INST_PAID_SUM", "sum", "AMT_PAYMENT"),
+            ("INST_UNDERPAID_SUM", "sum", lambda c: (c["AMT_INSTALMENT"] - c["AMT_PAYMENT"]).clip(lower=0)),
+        ],
+    },
+}
+
+
+# -------------------------
+# SK_ID_CURR index
+# -------------------------
+class IdIndex:
+    """Sorted SK_ID_CURR array mapping any key to its row in the applications table.
+
+    Ids must be unique: a duplicated key would silently map to one arbitrary
+    row (e.g. after the ids went through winsorizing), so it is rejected.
+    """
+
+    def __init__(self, ids):
+        ids = np.asarray(ids)
+        self.order = np.argsort(ids, kind="stable")
+        self.sorted_ids = ids[self.order]
+        self.size = len(ids)
+        dup = self.sorted_ids[1:] == self.sorted_ids[:-1]
+        if dup.any():
+            examples = np.unique(self.sorted_ids[1:][dup])[:5].tolist()
+            raise ValueError(f"{int(dup.sum()):,} duplicate ids in the index, e.g. {examples}")
+
+    @classmethod
+    def from_sorted(cls, sorted_ids, order):
+        """Rebuild an index persisted as its two arrays (no sort; may be memory-mapped)."""
+        index = cls.__new__(cls)
+        index.order, index.sorted_ids, index.size = order, sorted_ids, len(sorted_ids)
+        return index
+
+    def rows(self, keys):
+        """Row positions for `keys` and a mask of the keys that were found."""
+        keys = np.asarray(keys)
+        pos = np.searchsorted(self.sorted_ids, keys)
+        pos = np.minimum(pos, self.size - 1)
+        found = self.sorted_ids[pos] == keys
+        return self.order[pos], found
+
+
+def _values(chunk, source):
+    values = source(chunk) if callable(source) else chunk[source]
+    return np.nan_to_num(np.asarray(values, dtype="float64"))
+
+
+def aggregate_table(path, spec, index, chunksize=CHUNKSIZE):
+    """Stream `path` once and return {feature: array aligned with the applications}.
+
+    Only the aggregates (n_applicants x n_features) are held in memory; each
+    chunk is mapped to applicant rows via the index and folded in with
+    bincount (count/sum) or maximum.at (max).
+    """
+    out = {name: np.zeros(index.size) for name, _, _ in spec["features"]}
+    n_rows = n_unmatched = 0
+    for chunk in pd.read_csv(path, usecols=spec["usecols"], chunksize=chunksize):
+        rows, found = index.rows(chunk["SK_ID_CURR"].to_numpy())
+        n_rows += len(chunk)
+        n_unmatched += int((~found).sum())
+        rows, chunk = rows[found], chunk[found]
+        for name, op, source in spec["features"]:
+            values = _values(chunk, source)
+            if op in ("count", "sum"):
+                out[name] += np.bincount(rows, weights=values, minlength=index.size)
+            else:
+                np.maximum.at(out[name], rows, values)
+    print(f"{os.path.basename(path)}: {n_rows:,} rows streamed, {n_unmatched:,} without a matching applicant")
+    return out
+
+
+def enrich(df, data_dir=".", tables=AUX_TABLES, chunksize=CHUNKSIZE):
+    """Add per-applicant aggregates of the auxiliary tables to `df` (by position, no merge).
+
+    Tables that are not present in `data_dir` are skipped.
+    """
+    index = IdIndex(df["SK_ID_CURR"].to_numpy())
+    for file_name, spec in tables.items():
+        path = os.path.join(data_dir, file_name)
+        if not os.path.exists(path):
+            print(f"{file_name}: not found, skipped")
+            continue
+        ops = {name: op for name, op, _ in spec["features"]}
+        for name, values in aggregate_table(path, spec, index, chunksize).items():
+            df[name] = values.astype("int64") if ops[name] == "count" else values
+    return df
@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+
+# KPI computations shared by the Streamlit pages and the headless report
+# (report.py). Pure pandas/NumPy: nothing here imports streamlit.
+
+
+# -------------------------
+# Derived columns
+# -------------------------
+def add_affordability_columns(df):
+    # page 4 (financial.py) ratios
+    df["DTI"] = df["AMT_ANNUITY"] / df["AMT_INCOME_TOTAL"]
+    df["LTI"] = df["AMT_CREDIT"] / df["AMT_INCOME_TOTAL"]
+    return df
+
+
+def add_demographic_columns(df):
+    # page 3 (Demographic.py) whole-year age and employment years
+    df["AGE_YEARS"] = -(df["DAYS_BIRTH"] / 365).astype(int)
+    df["EMP_YEARS"] = -(df["DAYS_EMPLOYED"] / 365).replace({365243: np.nan})  # handle placeholder for unemployed
+    return df
+
+
+def target_risk_frame(df):
+    """Page 2 (Target&Risk.py) working frame: safe column fallbacks, EMP_YEARS, floored AGE_YEARS."""
+    def safe_col(col, fill=np.nan):
+        return df[col] if col in df.columns else pd.Series([fill] * len(df), index=df.index)
+
+    # handle placeholder 365243 (common in this dataset) -> treat as NaN
+    days_employed = safe_col("DAYS_EMPLOYED", np.nan).replace({365243: np.nan})
+    work = pd.DataFrame({
+        "TARGET": safe_col("TARGET", 0).astype(int),
+        "CODE_GENDER": safe_col("CODE_GENDER", "Unknown"),
+        "NAME_EDUCATION_TYPE": safe_col("NAME_EDUCATION_TYPE", "Unknown"),
+        "NAME_FAMILY_STATUS": safe_col("NAME_FAMILY_STATUS", "Unknown"),
+        "AMT_INCOME_TOTAL": pd.to_numeric(safe_col("AMT_INCOME_TOTAL", np.nan), errors="coerce"),
+        "AMT_CREDIT": pd.to_numeric(safe_col("AMT_CREDIT", np.nan), errors="coerce"),
+        "AMT_ANNUITY": pd.to_numeric(safe_col("AMT_ANNUITY", np.nan), errors="coerce"),
+        "EMP_YEARS": (-pd.to_numeric(days_employed, errors="coerce") / 365).replace([np.inf, -np.inf], np.nan),
+        "NAME_HOUSING_TYPE": safe_col("NAME_HOUSING_TYPE", "Unknown"),
+        "NAME_CONTRACT_TYPE": safe_col("NAME_CONTRACT_TYPE", "Unknown"),
+    })
+    if "DAYS_BIRTH" in df.columns:
+        work["AGE_YEARS"] = (-pd.to_numeric(df["DAYS_BIRTH"], errors="coerce") / 365).astype("float").apply(np.floor)
+    return work
+
+
+def default_rate_by(df, col):
+    return df.groupby(col)["TARGET"].mean() * 100
+
+
+# -------------------------
+# Page KPIs
+# -------------------------
+def overview_kpis(df, missing_share=None):
+    if missing_share is None:
+        missing_share = df.isnull().mean()
+    return {
+        "total_applicants": df["SK_ID_CURR"].nunique(),
+        "default_rate": df["TARGET"].mean() * 100,
+        "repaid_rate": 100 - df["TARGET"].mean() * 100,
+        "total_features": df.shape[1],
+        "avg_missing_per_feature": missing_share.mean() * 50,
+        "num_features": df.select_dtypes(include=[np.number]).shape[1],
+        "cat_features": df.select_dtypes(exclude=[np.number]).shape[1],
+        "median_age": df["AGE_YEARS"].median(),
+        "median_income": df["AMT_INCOME_TOTAL"].median(),
+        "avg_credit": df["AMT_CREDIT"].mean(),
+        "top_missing_feature": (missing_share * 100).sort_values(ascending=False).index[0],
+    }
+
+
+def target_risk_kpis(df, rate_by=None):
+    """`rate_by(col)` returns default % per level of col (pages pass a cached one).
+
+    The def_rate_* KPIs are the mean of those per-level rates.
+    """
+    rate_by = rate_by or (lambda col: default_rate_by(df, col))
+    df_def = df[df["TARGET"] == 1]
+    return {
+        "total_defaults": int(df["TARGET"].sum()),
+        "default_rate": df["TARGET"].mean() * 100,
+        "def_rate_gender": rate_by("CODE_GENDER").mean(),
+        "def_rate_edu": rate_by("NAME_EDUCATION_TYPE").mean(),
+        "def_rate_family": rate_by("NAME_FAMILY_STATUS").mean(),
+        "def_rate_housing": rate_by("NAME_HOUSING_TYPE").mean(),
+        "avg_income_def": df_def["AMT_INCOME_TOTAL"].mean(),
+        "avg_credit_def": df_def["AMT_CREDIT"].mean(),
+        "avg_annuity_def": df_def["AMT_ANNUITY"].mean(),
+        "avg_emp_def": df_def["EMPLOYMENT_YEARS"].mean(),
+    }
+
+
+def demographic_kpis(df):
+    """Expects the columns from `add_demographic_columns`."""
+    return {
+        "pct_male": df["CODE_GENDER"].eq("M").mean() * 100,
+        "pct_female": df["CODE_GENDER"].eq("F").mean() * 100,
+        "avg_age_def": df.loc[df["TARGET"] == 1, "AGE_YEARS"].mean(),
+        "avg_age_nondef": df.loc[df["TARGET"] == 0, "AGE_YEARS"].mean(),
+        "pct_with_children": df["CNT_CHILDREN"].gt(0).mean() * 100,
+        "avg_family_size": df["CNT_FAM_MEMBERS"].mean(),
+        "pct_married": df["NAME_FAMILY_STATUS"].str.contains("Married").mean() * 100,
+        "pct_single": df["NAME_FAMILY_STATUS"].str.contains("Single|Separated|Widow|Widower|Divorced").mean() * 100,
+        "pct_higher_edu": df["NAME_EDUCATION_TYPE"].isin(["Higher education", "Academic degree"]).mean() * 100,
+        "pct_with_parents": (df["NAME_HOUSING_TYPE"] == "With parents").mean() * 100,
+        "pct_working": df["OCCUPATION_TYPE"].ne("Other").mean() * 100,  # crude proxy
+        "avg_emp_years": df["EMPLOYMENT_YEARS"].mean(),
+    }
+
+
+def financial_kpis(df):
+    """Expects the columns from `add_affordability_columns`."""
+    repaid = df["TARGET"] == 0
+    defaulted = df["TARGET"] == 1
+    return {
+        "avg_income": df["AMT_INCOME_TOTAL"].mean(),
+        "median_income": df["AMT_INCOME_TOTAL"].median(),
+        "avg_credit": df["AMT_CREDIT"].mean(),
+        "avg_annuity": df["AMT_ANNUITY"].mean(),
+        "avg_goods_price": df["AMT_GOODS_PRICE"].mean(),
+        "avg_dti": df["DTI"].mean(),
+        "avg_lti": df["LTI"].mean(),
+        "income_gap": df.loc[repaid, "AMT_INCOME_TOTAL"].mean() - df.loc[defaulted, "AMT_INCOME_TOTAL"].mean(),
+        "credit_gap": df.loc[repaid, "AMT_CREDIT"].mean() - df.loc[defaulted, "AMT_CREDIT"].mean(),
+        "high_credit_pct": (df["AMT_CREDIT"] > 1_000_000).mean() * 100,
+    }
+
+
+def correlation_kpis(corr_matrix):
+    target_corr = corr_matrix["TARGET"].drop("TARGET").sort_values()
+    return {
+        "target_corr": target_corr,
+        "top_pos_corr": target_corr.tail(5),
+        "top_neg_corr": target_corr.head(5),
+        "top_pos_names": ", ".join(target_corr.tail(5).index.tolist()),
+        "top_neg_names": ", ".join(target_corr.head(5).index.tolist()),
+        "most_corr_income": corr_matrix["AMT_INCOME_TOTAL"].drop("AMT_INCOME_TOTAL").abs().idxmax(),
+        "most_corr_credit": corr_matrix["AMT_CREDIT"].drop("AMT_CREDIT").abs().idxmax(),
+        "corr_income_credit": corr_matrix.loc["AMT_INCOME_TOTAL", "AMT_CREDIT"],
+        "corr_age_target": corr_matrix.loc["AGE_YEARS", "TARGET"],
+        "corr_emp_target": corr_matrix.loc["DAYS_EMPLOYED", "TARGET"] if "DAYS_EMPLOYED" in corr_matrix else np.nan,
+        "corr_fam_target": corr_matrix.loc["CNT_FAM_MEMBERS", "TARGET"] if "CNT_FAM_MEMBERS" in corr_matrix else np.nan,
+        "top5_var_explained": target_corr.abs().nlargest(5).sum(),
+        "num_corr_gt_05": (target_corr.abs() > 0.5).sum(),
+    }
+
+
+# -------------------------
+# Display tables: (label, key, format) per page, used by the pages and report.py
+# -------------------------
+OVERVIEW_KPI_FORMATS = [
+    ("Total Applicants", "total_applicants", "{:,}"),
+    ("Default Rate (%)", "default_rate", "{:.2f}%"),
+    ("Repaid Rate (%)", "repaid_rate", "{:.2f}%"),
+    ("Total Features", "total_features", "{}"),
+    ("Num Features", "num_features", "{}"),
+    ("Cat Features", "cat_features", "{}"),
+    ("Avg Missing per Feature (%)", "avg_missing_per_feature", "{:.2f}%"),
+    ("Median Age (Years)", "median_age", "{:.0f}"),
+    ("Median Annual Income", "median_income", "{:,.0f}"),
+    ("Average Credit Amount", "avg_credit", "{:,.0f}"),
+]
+
+TARGET_RISK_KPI_FORMATS = [
+    ("Total Defaults", "total_defaults", "{:,.0f}"),
+    ("Default Rate (%)", "default_rate", "{:.2f}%"),
+    ("Avg Income (Defaulters)", "avg_income_def", "{:,.0f}"),
+    ("Avg Credit (Defaulters)", "avg_credit_def", "{:,.0f}"),
+    ("Avg Annuity (Defaulters)", "avg_annuity_def", "{:,.0f}"),
+    ("Avg Employment Years (Defaulters)", "avg_emp_def", "{:.1f}"),
+    ("Default Rate by Gender (%)", "def_rate_gender", "{:.2f}%"),
+    ("Default Rate by Education (%)", "def_rate_edu", "{:.2f}%"),
+    ("Default Rate by Family Status (%)", "def_rate_family", "{:.2f}%"),
+    ("Default Rate by Housing Type (%)", "def_rate_housing", "{:.2f}%"),
+]
+
+DEMOGRAPHIC_KPI_FORMATS = [
+    ("% Male", "pct_male", "{:.1f}%"),
+    ("% Female", "pct_female", "{:.1f}%"),
+    ("Avg Age — Defaulters", "avg_age_def", "{:.1f}"),
+    ("Avg Age — Non-Defaulters", "avg_age_nondef", "{:.1f}"),
+    ("% With Children", "pct_with_children", "{:.1f}%"),
+    ("Avg Family Size", "avg_family_size", "{:.1f}"),
+    ("% Married", "pct_married", "{:.1f}%"),
+    ("% Single/Other", "pct_single", "{:.1f}%"),
+    ("% Higher Education", "pct_higher_edu", "{:.1f}%"),
+    ("% Living With Parents", "pct_with_parents", "{:.1f}%"),
+    ("Avg Employment Years", "avg_emp_years", "{:.1f}"),
+]
+
+FINANCIAL_KPI_FORMATS = [
+    ("Avg Annual Income", "avg_income", "{:,.0f}"),
+    ("Median Annual Income", "median_income", "{:,.0f}"),
+    ("Avg Credit Amount", "avg_credit", "{:,.0f}"),
+    ("Avg Annuity", "avg_annuity", "{:,.0f}"),
+    ("Avg Goods Price", "avg_goods_price", "{:,.0f}"),
+    ("Avg DTI", "avg_dti", "{:.2f}"),
+    ("Avg LTI", "avg_lti", "{:.2f}"),
+    ("Income Gap (Non-def − Def)", "income_gap", "{:,.0f}"),
+    ("Credit Gap (Non-def − Def)", "credit_gap", "{:,.0f}"),
+    ("% High Credit (>1M)", "high_credit_pct", "{:.2f}%"),
+]
+
+CORRELATION_KPI_FORMATS = [
+    ("Top +Corr with TARGET", "top_pos_names", "{}"),
+    ("Top −Corr with TARGET", "top_neg_names", "{}"),
+    ("Most correlated with Income", "most_corr_income", "{}"),
+    ("Most correlated with Credit", "most_corr_credit", "{}"),
+    ("Corr(Income, Credit)", "corr_income_credit", "{:.2f}"),
+    ("Corr(Age, TARGET)", "corr_age_target", "{:.2f}"),
+    ("Corr(Employment Years, TARGET)", "corr_emp_target", "{:.2f}"),
+    ("Corr(Family Size, TARGET)", "corr_fam_target", "{:.2f}"),
+    ("Variance explained by Top 5", "top5_var_explained", "{:.2f}"),
+    ("# Features with |corr| > 0.5", "num_corr_gt_05", "{}"),
+]
+
+
+def format_kpis(formats, kpi):
+    """[(label, formatted value)] for one page's display table."""
+    return [(label, fmt.format(kpi[key])) for label, key, fmt in formats]
@@ -1,8 +1,113 @@
+import os
+
 import pandas as pd
 import streamlit as st
 
+from utils.applicant_store import META_FILE, STORE_DIR, ApplicantStore
+from utils.partitions import INDEX_FILE, PARTITION_DIR, key_levels, rate_by, scan
+from utils.versioning import cached_artifact, dataset_version
+
+CLEANED_PATH = "application_train_cleaned.csv"
+SCORES_PATH = "application_scores.csv"
+SAMPLE_PATH = "application_sample.csv"
+
+
+def data_version(file_path=CLEANED_PATH):
+    # content-addressed version from data_manifest.json; key for every downstream cache
+    return dataset_version(file_path)
+
+
+@st.cache_data(max_entries=4)
+def _read_csv(file_path, version):
+    # `version` is only part of the cache key: a regenerated file gets a new
+    # version, so stale in-memory and on-disk copies are never served
+    return cached_artifact("csv-" + file_path.replace("/", "_"), version, lambda: pd.read_csv(file_path))
+
+
+def load_data(file_path=CLEANED_PATH):
+    df = _read_csv(file_path, data_version(file_path))
+    return df
+
+
+def load_scores(file_path=SCORES_PATH):
+    # written by the scoring step at the end of preprocessing.ipynb
+    scores = _read_csv(file_path, data_version(file_path))
+    return scores
+
+
+def load_sample(file_path=SAMPLE_PATH):
+    # stratified sample with SAMPLE_WEIGHT, written by preprocessing.ipynb
+    sample = _read_csv(file_path, data_version(file_path))
+    return sample
+
+
+# -------------------------
+# Segment queries on the partitioned copy (falls back to the single CSV
+# when preprocessing has not written application_partitions/ yet)
+# -------------------------
+def has_partitions(part_dir=PARTITION_DIR):
+    return os.path.exists(os.path.join(part_dir, INDEX_FILE))
+
+
+def partitions_version(part_dir=PARTITION_DIR):
+    return data_version(os.path.join(part_dir, INDEX_FILE))
+
+
+def segment_version(part_dir=PARTITION_DIR):
+    # version of what load_segment reads: the partitions, or the cleaned CSV without them
+    return partitions_version(part_dir) if has_partitions(part_dir) else data_version()
+
+
+def _matches(df, filters):
+    mask = pd.Series(True, index=df.index)
+    for col, values in (filters or {}).items():
+        mask &= df[col].astype(str).isin([str(v) for v in values])
+    return mask
+
+
+@st.cache_data(max_entries=8)
+def _scan(part_dir, version, filters, columns):
+    return scan(dict(filters), columns=list(columns) if columns else None, part_dir=part_dir)
+
+
+def load_segment(filters=None, columns=None, part_dir=PARTITION_DIR):
+    """Rows whose partition keys match `filters` ({col: [values]}), only `columns`.
+
+    Only the partitions left after pruning are read, in parallel.
+    """
+    if not has_partitions(part_dir):
+        df = load_data()
+        return df.loc[_matches(df, filters), columns or df.columns].reset_index(drop=True)
+    frozen = tuple(sorted((k, tuple(v)) for k, v in (filters or {}).items()))
+    return _scan(part_dir, partitions_version(part_dir), frozen, tuple(columns or ()))
+
+
+def segment_levels(key, part_dir=PARTITION_DIR):
+    if not has_partitions(part_dir):
+        return sorted(load_data()[key].dropna().astype(str).unique())
+    return key_levels(key, part_dir)
+
+
+def segment_rate_by(group_col, filters=None, part_dir=PARTITION_DIR):
+    """Default % per level of `group_col` within the segment, cached per data version."""
+    frozen = tuple(sorted((k, tuple(v)) for k, v in (filters or {}).items()))
+    if not has_partitions(part_dir):
+        def compute():
+            # the full table is read only on a cache miss
+            df = load_data()
+            return df[_matches(df, filters)].groupby(group_col)["TARGET"].mean() * 100
+
+        return cached_artifact("segment-rate-by", data_version(), compute, group_col, frozen)
+    return cached_artifact("segment-rate-by", partitions_version(part_dir),
+                           lambda: rate_by(group_col, dict(frozen), part_dir), group_col, frozen)
+
+
+@st.cache_resource(max_entries=2)
+def _open_store(store_dir, version):
+    return ApplicantStore(store_dir)
+
 
-@st.cache_data
-def load_data(file_path="application_train_cleaned.csv"):
-    df = pd.read_csv(file_path)
-    return df
\ No newline at end of file
+def load_applicant_store(store_dir=STORE_DIR):
+    # memory-mapped columnar copy + id index written by preprocessing.ipynb;
+    # opening maps the files, rows are only read when an applicant is looked up
+    return _open_store(store_dir, data_version(os.path.join(store_dir, META_FILE)))
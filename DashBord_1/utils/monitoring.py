@@ -0,0 +1,164 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+MONITOR_PATH = "monitoring_aggregates.json"
+
+# columns tracked with count / sum / sum of squares per period
+MOMENT_COLS = ["AMT_INCOME_TOTAL", "AMT_CREDIT", "AMT_ANNUITY", "LTI", "DTI", "AGE_YEARS"]
+
+# fixed-edge histogram sketches: identical edges in every period, so two
+# periods merge by adding counts and medians/PSI never need the raw rows
+SKETCH_EDGES = {
+    "AMT_INCOME_TOTAL": np.r_[0, np.geomspace(10_000, 10_000_000, 121)],
+    "AGE_YEARS": np.linspace(18, 75, 115),
+}
+HIGH_CREDIT = 1_000_000
+
+
+# -------------------------
+# Per-period aggregates
+# -------------------------
+def period_aggregates(df, missing_share=None):
+    """Mergeable aggregates of one period of applications (a single pass).
+
+    `missing_share` (column -> fraction) lets preprocessing record
+    missingness measured before imputation; otherwise it is taken from `df`.
+    """
+    n = len(df)
+    agg = {"count": n, "target_sum": int(df["TARGET"].sum()),
+           "high_credit": int((df["AMT_CREDIT"] > HIGH_CREDIT).sum()), "moments": {}, "sketches": {}}
+
+    for col in MOMENT_COLS:
+        if col not in df:
+            continue
+        x = df[col].to_numpy(dtype="float64")
+        x = x[np.isfinite(x)]
+        agg["moments"][col] = [int(x.size), float(x.sum()), float(np.dot(x, x))]
+
+    for col, edges in SKETCH_EDGES.items():
+        if col not in df:
+            continue
+        x = np.clip(df[col].to_numpy(dtype="float64"), edges[0], edges[-1])
+        agg["sketches"][col] = np.histogram(x[np.isfinite(x)], bins=edges)[0].tolist()
+
+    if missing_share is None:
+        missing_share = df.isnull().mean()
+    agg["missing"] = {col: int(round(share * n)) for col, share in missing_share.items()}
+    return agg
+
+
+def merge_aggregates(aggs):
+    """Combine period aggregates (e.g. a rolling window) by adding their parts."""
+    out = {"count": 0, "target_sum": 0, "high_credit": 0, "moments": {}, "sketches": {}, "missing": {}}
+    for agg in aggs:
+        out["count"] += agg["count"]
+        out["target_sum"] += agg["target_sum"]
+        out["high_credit"] += agg["high_credit"]
+        for col, m in agg["moments"].items():
+            prev = out["moments"].get(col, [0, 0.0, 0.0])
+            out["moments"][col] = [a + b for a, b in zip(prev, m)]
+        for col, counts in agg["sketches"].items():
+            prev = out["sketches"].get(col)
+            out["sketches"][col] = counts if prev is None else [a + b for a, b in zip(prev, counts)]
+        for col, miss in agg["missing"].items():
+            out["missing"][col] = out["missing"].get(col, 0) + miss
+    return out
+
+
+def sketch_quantile(col, counts, q):
+    edges = SKETCH_EDGES[col]
+    counts = np.asarray(counts, dtype="float64")
+    cum = np.cumsum(counts)
+    if cum[-1] == 0:
+        return np.nan
+    target = q * cum[-1]
+    i = int(np.searchsorted(cum, target))
+    before = cum[i - 1] if i else 0.0
+    frac = (target - before) / counts[i] if counts[i] else 0.0
+    return edges[i] + frac * (edges[i + 1] - edges[i])
+
+
+def psi(expected, actual, eps=1e-6):
+    """Population stability index between two sketches of the same column."""
+    e = np.asarray(expected, dtype="float64")
+    a = np.asarray(actual, dtype="float64")
+    e = e / max(e.sum(), 1) + eps
+    a = a / max(a.sum(), 1) + eps
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def kpis(agg):
+    """The Overview / Financial KPIs, computed from aggregates only."""
+    n = agg["count"]
+    out = {
+        "Applicants": n,
+        "Default Rate (%)": agg["target_sum"] / n * 100 if n else np.nan,
+        "% High Credit (>1M)": agg["high_credit"] / n * 100 if n else np.nan,
+    }
+    for col, (cnt, s1, s2) in agg["moments"].items():
+        mean = s1 / cnt if cnt else np.nan
+        out[f"Avg {col}"] = mean
+        out[f"Std {col}"] = np.sqrt(max(s2 / cnt - mean**2, 0.0)) if cnt else np.nan
+    for col, counts in agg["sketches"].items():
+        out[f"Median {col}"] = sketch_quantile(col, counts, 0.5)
+    n_cols = len(agg["missing"])
+    out["Avg Missing per Feature (%)"] = (
+        sum(agg["missing"].values()) / (n * n_cols) * 100 if n and n_cols else np.nan
+    )
+    return out
+
+
+# -------------------------
+# Store (one JSON file, one entry per period)
+# -------------------------
+def load_store(path=MONITOR_PATH):
+    if not os.path.exists(path):
+        return {"periods": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_store(store, path=MONITOR_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(store, f)
+    os.replace(tmp_path, path)
+
+
+def add_period(store, period, df, missing_share=None, version=None):
+    """Add (or replace) one period; cost is O(rows in that period) only.
+
+    `version` is the cleaned data's dataset version. It is kept in the
+    entry, and a version already recorded under another period is skipped:
+    re-running preprocessing on the same extract adds no new vintage.
+    """
+    period = str(period)
+    if version is not None and any(agg.get("version") == version
+                                   for p, agg in store["periods"].items() if p != period):
+        return store
+    store["periods"][period] = {**period_aggregates(df, missing_share), "version": version}
+    store["periods"] = dict(sorted(store["periods"].items()))
+    return store
+
+
+def trend_frame(store, window=1):
+    """KPIs per period over a rolling window of `window` periods."""
+    periods = list(store["periods"])
+    rows = {}
+    for i, period in enumerate(periods):
+        chunk = [store["periods"][p] for p in periods[max(0, i - window + 1):i + 1]]
+        rows[period] = kpis(merge_aggregates(chunk))
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def sketch_drift(store, col, baseline=None):
+    """PSI of each period's `col` sketch against `baseline` (default: first period)."""
+    periods = store["periods"]
+    if not periods:
+        return pd.Series(dtype="float64")
+    base = periods[baseline or next(iter(periods))]["sketches"].get(col)
+    return pd.Series({p: psi(base, agg["sketches"][col]) for p, agg in periods.items()
+                      if base is not None and col in agg["sketches"]}, name=f"PSI {col}")
@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.versioning import _atomic_write
+
+PARTITION_DIR = "application_partitions"
+PARTITION_COLS = ["NAME_CONTRACT_TYPE", "INCOME_BRACKET"]
+INDEX_FILE = "_partitions.json"
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+# -------------------------
+# Write (once, in preprocessing)
+# -------------------------
+def partition_stats(part):
+    """Row count, TARGET sum and min/max of every numeric column of one partition."""
+    numeric = part.select_dtypes(include=[np.number])
+    lo, hi = numeric.min(), numeric.max()
+    return {
+        "rows": len(part),
+        "target_sum": int(part["TARGET"].sum()) if "TARGET" in part else None,
+        "min": {c: float(lo[c]) for c in numeric if pd.notna(lo[c])},
+        "max": {c: float(hi[c]) for c in numeric if pd.notna(hi[c])},
+    }
+
+
+def write_partitions(df, part_dir=PARTITION_DIR, keys=PARTITION_COLS):
+    """Write `df` as one CSV per combination of `keys`, plus an index of partition stats.
+
+    Layout is `key=value/.../part.csv`; `_partitions.json` lists every
+    partition with its key values and `partition_stats`, which is all the
+    loader needs to prune partitions without opening them. `part_dir` is
+    cleared first, so partitions of an earlier run never linger.
+    """
+    keys = [k for k in keys if k in df]
+    shutil.rmtree(part_dir, ignore_errors=True)
+    partitions = []
+    for values, part in df.groupby(keys, sort=True, observed=True, dropna=False):
+        values = dict(zip(keys, map(str, values)))
+        rel_path = os.path.join(*[f"{k}={v}" for k, v in values.items()], "part.csv")
+        os.makedirs(os.path.join(part_dir, os.path.dirname(rel_path)), exist_ok=True)
+        part.to_csv(os.path.join(part_dir, rel_path), index=False)
+        partitions.append({"path": rel_path, "keys": values, **partition_stats(part)})
+
+    index = {"keys": keys, "columns": df.columns.tolist(), "partitions": partitions}
+    path = os.path.join(part_dir, INDEX_FILE)
+    _atomic_write(path, lambda f: json.dump(index, f, indent=1))
+    return path
+
+
+def read_index(part_dir=PARTITION_DIR):
+    with open(os.path.join(part_dir, INDEX_FILE)) as f:
+        return json.load(f)
+
+
+# -------------------------
+# Pruning
+# -------------------------
+def prune(index, filters=None, ranges=None):
+    """Partitions that can hold rows matching the query.
+
+    `filters` maps a partition key to its allowed values; `ranges` maps a
+    numeric column to (lo, hi) and drops partitions whose min/max lie
+    entirely outside it.
+    """
+    filters = {k: {str(v) for v in np.atleast_1d(vals)} for k, vals in (filters or {}).items()}
+    kept = []
+    for part in index["partitions"]:
+        if any(part["keys"].get(k) not in allowed for k, allowed in filters.items() if k in part["keys"]):
+            continue
+        if any(col in part["min"] and (part["max"][col] < lo or part["min"][col] > hi)
+               for col, (lo, hi) in (ranges or {}).items()):
+            continue
+        kept.append(part)
+    return kept
+
+
+# -------------------------
+# Map-reduce over partitions
+# -------------------------
+def _read_part(part_dir, part, columns):
+    return pd.read_csv(os.path.join(part_dir, part["path"]), usecols=columns)
+
+
+def map_partitions(fn, parts, part_dir=PARTITION_DIR, columns=None, workers=WORKERS):
+    """[fn(frame) for each partition], reading partitions in parallel threads."""
+    if not parts:
+        return []
+    with ThreadPoolExecutor(max_workers=min(workers, len(parts))) as pool:
+        return list(pool.map(lambda part: fn(_read_part(part_dir, part, columns)), parts))
+
+
+def _row_filters(index, filters):
+    # filters on non-key columns cannot prune partitions; they are applied to rows
+    return {k: [str(v) for v in np.atleast_1d(vals)] for k, vals in (filters or {}).items()
+            if k not in index["keys"]}
+
+
+def _row_mask(frame, row_filters, ranges):
+    mask = np.ones(len(frame), dtype=bool)
+    for col, values in row_filters.items():
+        mask &= frame[col].astype(str).isin(values).to_numpy()
+    for col, (lo, hi) in ranges.items():
+        mask &= frame[col].between(lo, hi).to_numpy()
+    return mask
+
+
+def scan(filters=None, ranges=None, columns=None, part_dir=PARTITION_DIR, workers=WORKERS):
+    """Rows matching `filters`/`ranges`, reading only the surviving partitions.
+
+    Filters on partition keys are settled by pruning alone; filters on other
+    columns and range filters are applied to the rows of the partitions that
+    survive. Rows come back grouped by partition.
+    """
+    index = read_index(part_dir)
+    ranges = ranges or {}
+    row_filters = _row_filters(index, filters)
+    usecols = None if columns is None else list(dict.fromkeys([*columns, *row_filters, *ranges]))
+
+    def select(frame):
+        return frame.loc[_row_mask(frame, row_filters, ranges), columns or frame.columns]
+
+    frames = map_partitions(select, prune(index, filters, ranges), part_dir, usecols, workers)
+    if not frames:
+        return pd.DataFrame(columns=columns or index["columns"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def rate_by(group_col, filters=None, part_dir=PARTITION_DIR, workers=WORKERS, target="TARGET"):
+    """Default % per level of `group_col` over the partitions matching `filters`.
+
+    Grouping by a partition key with only key filters is answered from the
+    index stats alone; otherwise each partition maps to (sum, count) per
+    level of its filtered rows and the partials are summed.
+    """
+    index = read_index(part_dir)
+    parts = prune(index, filters)
+    row_filters = _row_filters(index, filters)
+    if group_col in index["keys"] and not row_filters:
+        partials = [pd.DataFrame({"sum": [p["target_sum"]], "count": [p["rows"]]}, index=[p["keys"][group_col]])
+                    for p in parts]
+    else:
+        def partial(frame):
+            frame = frame[_row_mask(frame, row_filters, {})]
+            return frame.groupby(group_col)[target].agg(["sum", "count"])
+
+        usecols = list(dict.fromkeys([group_col, target, *row_filters]))
+        partials = map_partitions(partial, parts, part_dir, usecols, workers)
+    if not partials:
+        return pd.Series(dtype="float64", name=target)
+    totals = pd.concat(partials).groupby(level=0).sum()
+    return (totals["sum"] / totals["count"] * 100).rename(target).rename_axis(group_col)
+
+
+def key_levels(key, part_dir=PARTITION_DIR):
+    """Values of partition key `key` (sidebar filter options, no data read)."""
+    return sorted({p["keys"][key] for p in read_index(part_dir)["partitions"] if key in p["keys"]})
@@ -0,0 +1,64 @@
+import os
+
+import streamlit as st
+
+from utils.load_data import SAMPLE_PATH, data_version, load_sample
+from utils.sampling import replicate_weights
+from utils.versioning import cached_artifact
+
+
+# -------------------------
+# Approximate-first KPI display
+# -------------------------
+def preview_toggle():
+    available = os.path.exists(SAMPLE_PATH)
+    return st.sidebar.toggle(
+        "⚡ Preview mode (approximate KPIs first)",
+        value=available,
+        disabled=not available,
+        help="Show KPIs from the stratified sample with 95% intervals, then refine to exact values.",
+    )
+
+
+@st.cache_data(max_entries=2)
+def load_replicates(version):
+    # bootstrap weights depend only on the sample, so they are cached with it
+    return cached_artifact("bootstrap-weights", version, lambda: replicate_weights(load_sample()))
+
+
+def preview_inputs():
+    return load_sample(), load_replicates(data_version(SAMPLE_PATH))
+
+
+@st.cache_data(max_entries=4)
+def _cached_estimates(name, version, _estimate):
+    return cached_artifact(f"estimates-{name}", version, lambda: _estimate(*preview_inputs()))
+
+
+def preview_estimates(estimate):
+    """`estimate(sample, reps)`, cached per sample version (in memory and on disk).
+
+    The estimates depend only on the sample, so a rerun (any widget click)
+    reuses them instead of recomputing.
+    """
+    return _cached_estimates(estimate.__name__, data_version(SAMPLE_PATH), estimate)
+
+
+def kpi_slots(labels, per_row=3):
+    """One placeholder per KPI, laid out in rows of `per_row` columns."""
+    slots = {}
+    for i in range(0, len(labels), per_row):
+        cols = st.columns(per_row)
+        for col, label in zip(cols, labels[i:i + per_row]):
+            slots[label] = col.empty()
+    return slots
+
+
+def show_estimate(slot, label, est, fmt):
+    with slot.container():
+        st.metric(label, "≈ " + fmt.format(est.value))
+        st.caption(f"95% CI {fmt.format(est.lo)} – {fmt.format(est.hi)}")
+
+
+def show_exact(slot, label, value, fmt):
+    slot.metric(label, fmt.format(value))
@@ -0,0 +1,197 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_PATH = "application_sample.csv"
+SAMPLE_SIZE = 50_000
+STRATA = ["TARGET", "NAME_CONTRACT_TYPE", "CODE_GENDER"]
+MIN_PER_STRATUM = 30
+N_BOOT = 200
+Z95 = 1.96
+
+Estimate = namedtuple("Estimate", ["value", "lo", "hi"])
+
+
+# -------------------------
+# Stratified sample (built once in preprocessing)
+# -------------------------
+def stratified_sample(df, n=SAMPLE_SIZE, strata=STRATA, min_per_stratum=MIN_PER_STRATUM, seed=42):
+    """Proportional stratified sample with a floor per stratum.
+
+    Adds `STRATUM` (integer id) and `SAMPLE_WEIGHT` (N_h / n_h) so every
+    estimator below can undo the oversampling of small strata.
+    """
+    strata = [s for s in strata if s in df]
+    stratum = df.groupby(strata, sort=True, observed=True, dropna=False).ngroup().to_numpy()
+    sizes = np.bincount(stratum)
+    take = np.minimum(sizes, np.maximum(np.round(sizes * n / len(df)).astype(int), min_per_stratum))
+
+    rng = np.random.default_rng(seed)
+    # random key per row; keep the `take[h]` smallest keys inside each stratum
+    order = np.lexsort((rng.random(len(df)), stratum))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rank = np.empty(len(df), dtype=np.intp)
+    rank[order] = np.arange(len(df)) - np.repeat(starts, sizes)
+    chosen = rank < take[stratum]
+
+    sample = df[chosen].copy()
+    sample["STRATUM"] = stratum[chosen]
+    sample["SAMPLE_WEIGHT"] = (sizes / take)[stratum[chosen]]
+    return sample
+
+
+def _strata_arrays(sample):
+    h = sample["STRATUM"].to_numpy()
+    w = sample["SAMPLE_WEIGHT"].to_numpy(dtype="float64")
+    _, h = np.unique(h, return_inverse=True)
+    n_h = np.bincount(h).astype("float64")
+    N_h = np.bincount(h, weights=w)
+    return h, w, n_h, N_h
+
+
+# -------------------------
+# Analytic CI: stratified mean
+# -------------------------
+def approx_mean(sample, values):
+    """Stratified estimate of the population mean of `values` (aligned with `sample`).
+
+    Var = sum_h (N_h/N)^2 (1 - n_h/N_h) s_h^2 / n_h, the textbook stratified
+    variance with finite population correction.
+    """
+    x = np.asarray(values, dtype="float64")
+    h, w, n_h, N_h = _strata_arrays(sample)
+    ok = ~np.isnan(x)
+    h, x = h[ok], x[ok]
+    n_h = np.bincount(h, minlength=len(N_h)).astype("float64")
+    safe_n = np.maximum(n_h, 1)
+    mean_h = np.bincount(h, weights=x, minlength=len(N_h)) / safe_n
+    ss_h = np.bincount(h, weights=(x - mean_h[h]) ** 2, minlength=len(N_h))
+    var_h = ss_h / np.maximum(n_h - 1, 1)
+    W = np.where(n_h > 0, N_h, 0) / N_h[n_h > 0].sum()
+    value = np.dot(W, mean_h)
+    var = np.sum(W**2 * (1 - n_h / N_h) * var_h / safe_n)
+    half = Z95 * np.sqrt(var)
+    return Estimate(value, value - half, value + half)
+
+
+# -------------------------
+# Vectorized bootstrap: replicate weights
+# -------------------------
+def replicate_weights(sample, n_boot=N_BOOT, seed=7):
+    """(n_boot, n) float32 bootstrap weights: sampling weight x Poisson(1) draw.
+
+    The Poisson bootstrap resamples every stratum independently, and every
+    statistic becomes a matrix product against this one array.
+    """
+    rng = np.random.default_rng(seed)
+    w = sample["SAMPLE_WEIGHT"].to_numpy(dtype="float32")
+    return rng.poisson(1.0, size=(n_boot, len(sample))).astype("float32") * w
+
+
+def _ci(point, replicates):
+    lo, hi = np.nanpercentile(replicates, [2.5, 97.5], axis=0)
+    return Estimate(point, lo, hi)
+
+
+def _domain_means(weights, values, masks):
+    # weighted mean of `values` inside each boolean mask; weights is (B, n) or (n,)
+    x = np.nan_to_num(np.asarray(values, dtype="float64"))
+    valid = ~np.isnan(np.asarray(values, dtype="float64"))
+    D = (np.column_stack(masks) & valid[:, None]).astype("float32")
+    num = weights @ (D * x[:, None].astype("float32"))
+    den = weights @ D
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return num / den
+
+
+def approx_domain_means(sample, values, masks, reps):
+    """Mean of `values` within each mask, with bootstrap CIs (one matmul)."""
+    w = sample["SAMPLE_WEIGHT"].to_numpy(dtype="float64")
+    point = _domain_means(w, values, masks)
+    boot = _domain_means(reps, values, masks)
+    return [_ci(point[j], boot[:, j]) for j in range(len(masks))]
+
+
+def approx_rates_by(sample, group_col, reps, target="TARGET"):
+    """Default % per level of `group_col`, with the (B, G) replicate matrix."""
+    levels = pd.Index(sample[group_col].dropna().unique()).sort_values()
+    col = sample[group_col].to_numpy()
+    masks = [col == level for level in levels]
+    y = sample[target].to_numpy(dtype="float64")
+    w = sample["SAMPLE_WEIGHT"].to_numpy(dtype="float64")
+    point = pd.Series(_domain_means(w, y, masks) * 100, index=levels)
+    return point, _domain_means(reps, y, masks) * 100
+
+
+def approx_mean_of_rates(sample, group_col, reps, target="TARGET"):
+    """The pages' 'Default Rate by X' KPI: unweighted mean over segment rates."""
+    point, boot = approx_rates_by(sample, group_col, reps, target)
+    return _ci(point.mean(), np.nanmean(boot, axis=1))
+
+
+def approx_gap(sample, values, reps, by="TARGET"):
+    """mean(values | by == 0) - mean(values | by == 1), e.g. the income gap."""
+    g = sample[by].to_numpy()
+    w = sample["SAMPLE_WEIGHT"].to_numpy(dtype="float64")
+    masks = [g == 0, g == 1]
+    point = _domain_means(w, values, masks)
+    boot = _domain_means(reps, values, masks)
+    return _ci(point[0] - point[1], boot[:, 0] - boot[:, 1])
+
+
+def approx_median(sample, values, reps):
+    """Weighted median with bootstrap CI (one sort, cumulative weights per replicate)."""
+    x = np.asarray(values, dtype="float64")
+    ok = ~np.isnan(x)
+    order = np.argsort(x[ok])
+    xs = x[ok][order]
+
+    def weighted_median(weights):
+        cum = np.cumsum(weights[..., ok][..., order], axis=-1, dtype="float64")
+        half = cum[..., -1:] / 2
+        return xs[np.argmax(cum >= half, axis=-1)]
+
+    point = weighted_median(sample["SAMPLE_WEIGHT"].to_numpy(dtype="float64"))
+    return _ci(point, weighted_median(reps))
+
+
+# -------------------------
+# Page KPI estimates (same keys as utils/kpis.py)
+# -------------------------
+def target_risk_estimates(sample, reps):
+    y = sample["TARGET"].to_numpy(dtype="float64")
+    n_pop = sample["SAMPLE_WEIGHT"].sum()
+    rate = approx_mean(sample, y)
+    defaulted = [y == 1]
+    est = {
+        "total_defaults": Estimate(*(np.array(rate) * n_pop)),
+        "default_rate": Estimate(*(np.array(rate) * 100)),
+        "def_rate_gender": approx_mean_of_rates(sample, "CODE_GENDER", reps),
+        "def_rate_edu": approx_mean_of_rates(sample, "NAME_EDUCATION_TYPE", reps),
+        "def_rate_family": approx_mean_of_rates(sample, "NAME_FAMILY_STATUS", reps),
+        "def_rate_housing": approx_mean_of_rates(sample, "NAME_HOUSING_TYPE", reps),
+    }
+    for key, col in [("avg_income_def", "AMT_INCOME_TOTAL"), ("avg_credit_def", "AMT_CREDIT"),
+                     ("avg_annuity_def", "AMT_ANNUITY"), ("avg_emp_def", "EMPLOYMENT_YEARS")]:
+        est[key] = approx_domain_means(sample, sample[col], defaulted, reps)[0]
+    return est
+
+
+def financial_estimates(sample, reps):
+    income = sample["AMT_INCOME_TOTAL"].to_numpy(dtype="float64")
+    credit = sample["AMT_CREDIT"].to_numpy(dtype="float64")
+    annuity = sample["AMT_ANNUITY"].to_numpy(dtype="float64")
+    high = approx_mean(sample, credit > 1_000_000)
+    return {
+        "avg_income": approx_mean(sample, income),
+        "median_income": approx_median(sample, income, reps),
+        "avg_credit": approx_mean(sample, credit),
+        "avg_annuity": approx_mean(sample, annuity),
+        "avg_goods_price": approx_mean(sample, sample["AMT_GOODS_PRICE"]),
+        "avg_dti": approx_mean(sample, annuity / income),
+        "avg_lti": approx_mean(sample, credit / income),
+        "income_gap": approx_gap(sample, income, reps),
+        "credit_gap": approx_gap(sample, credit, reps),
+        "high_credit_pct": Estimate(*(np.array(high) * 100)),
+    }
@@ -0,0 +1,148 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------------
+# Features (from the Target & Risk "next hypotheses")
+# -------------------------
+BASE_FEATURES = ["LTI", "DTI", "EMPLOYMENT_YEARS", "AGE_YEARS", "LOG_INCOME"]
+INTERACTIONS = [("LTI", "DTI"), ("LTI", "EMPLOYMENT_YEARS"), ("DTI", "EMPLOYMENT_YEARS")]
+FEATURES = BASE_FEATURES + [f"{a}_x_{b}" for a, b in INTERACTIONS]
+
+# PD cut-offs for the risk bands (upper bounds, last band is open-ended)
+BAND_EDGES = [0.04, 0.06, 0.08, 0.12, 0.20]
+BAND_LABELS = ["A", "B", "C", "D", "E", "F"]
+
+SCORE_BATCH = 262_144
+
+
+def build_features(df):
+    """Return the (n, p) float64 design matrix (no intercept) for `df`."""
+    n = len(df)
+    X = np.empty((n, len(FEATURES)), dtype="float64")
+    base = {
+        "LTI": df["LTI"].to_numpy(dtype="float64"),
+        "DTI": df["DTI"].to_numpy(dtype="float64"),
+        "EMPLOYMENT_YEARS": df["EMPLOYMENT_YEARS"].to_numpy(dtype="float64"),
+        "AGE_YEARS": df["AGE_YEARS"].to_numpy(dtype="float64"),
+        "LOG_INCOME": np.log1p(df["AMT_INCOME_TOTAL"].to_numpy(dtype="float64")),
+    }
+    for j, name in enumerate(BASE_FEATURES):
+        X[:, j] = base[name]
+    for k, (a, b) in enumerate(INTERACTIONS, start=len(BASE_FEATURES)):
+        np.multiply(base[a], base[b], out=X[:, k])
+    # cleaned data is imputed, but keep scoring total on odd rows
+    np.nan_to_num(X, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    return X
+
+
+def _as_chunks(data):
+    # `data` is either (X, y) or a zero-arg callable yielding (X, y) chunks,
+    # so chunked sources can be re-read once per Newton step
+    if callable(data):
+        return data()
+    return [data]
+
+
+def _sigmoid(z, out=None):
+    # numerically stable 1 / (1 + exp(-z))
+    out = np.negative(z, out=out)
+    with np.errstate(over="ignore"):
+        np.exp(out, out=out)
+    out += 1.0
+    np.reciprocal(out, out=out)
+    return out
+
+
+# -------------------------
+# Fit: logistic regression by IRLS / Newton
+# -------------------------
+def fit_logistic(data, max_iter=25, tol=1e-8, l2=1e-6):
+    """Fit a logistic model with Newton/IRLS in pure NumPy.
+
+    Every iteration accumulates the gradient and Hessian chunk by chunk, so
+    memory is bounded by the largest chunk. Features are standardised with
+    means/stds from a first pass over the same chunks. Returns a model dict
+    with `features`, `mean`, `scale` and `coef` (intercept first).
+    """
+    # pass 1 — standardisation stats
+    n, s1, s2 = 0, 0.0, 0.0
+    for X, _ in _as_chunks(data):
+        n += X.shape[0]
+        s1 = s1 + X.sum(axis=0)
+        s2 = s2 + np.einsum("ij,ij->j", X, X)
+    mean = s1 / n
+    scale = np.sqrt(np.maximum(s2 / n - mean**2, 0.0))
+    scale[scale == 0] = 1.0
+
+    p = mean.shape[0] + 1
+    coef = np.zeros(p)
+    ridge = l2 * np.eye(p)
+    ridge[0, 0] = 0.0  # no penalty on the intercept
+    for _ in range(max_iter):
+        grad = -ridge @ coef
+        hess = ridge.copy()
+        for X, y in _as_chunks(data):
+            Z = np.empty((X.shape[0], p))
+            Z[:, 0] = 1.0
+            np.subtract(X, mean, out=Z[:, 1:])
+            Z[:, 1:] /= scale
+            prob = _sigmoid(Z @ coef)
+            grad += Z.T @ (np.asarray(y, dtype="float64") - prob)
+            w = prob * (1.0 - prob)
+            hess += (Z * w[:, None]).T @ Z
+        step = np.linalg.solve(hess, grad)
+        coef += step
+        if np.max(np.abs(step)) < tol:
+            break
+
+    return {"features": list(FEATURES), "mean": mean, "scale": scale, "coef": coef}
+
+
+# -------------------------
+# Score: batched, vectorized PD
+# -------------------------
+def score(X, model, batch_size=SCORE_BATCH):
+    """Probability of default for every row of `X`, in fixed-size batches."""
+    coef = np.asarray(model["coef"], dtype="float64")
+    # fold the standardisation into the weights: one mat-vec per batch
+    w = coef[1:] / np.asarray(model["scale"], dtype="float64")
+    b = coef[0] - np.dot(w, np.asarray(model["mean"], dtype="float64"))
+    pd_out = np.empty(X.shape[0], dtype="float64")
+    for start in range(0, X.shape[0], batch_size):
+        stop = start + batch_size
+        z = np.dot(X[start:stop], w, out=pd_out[start:stop])
+        z += b
+        _sigmoid(z, out=z)
+    return pd_out
+
+
+def risk_band(pd_values):
+    labels = np.asarray(BAND_LABELS, dtype=object)
+    return labels[np.searchsorted(BAND_EDGES, pd_values, side="right")]
+
+
+def save_model(model, path="pd_model.json"):
+    payload = {k: (v.tolist() if isinstance(v, np.ndarray) else v) for k, v in model.items()}
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_model(path="pd_model.json"):
+    with open(path) as f:
+        payload = json.load(f)
+    for key in ("mean", "scale", "coef"):
+        payload[key] = np.asarray(payload[key], dtype="float64")
+    return payload
+
+
+def score_frame(df, model):
+    """SK_ID_CURR / TARGET / PD / RISK_BAND table for the risk-band page."""
+    pd_values = score(build_features(df), model)
+    scores = pd.DataFrame({"SK_ID_CURR": df["SK_ID_CURR"].to_numpy(), "PD": pd_values})
+    if "TARGET" in df:
+        scores["TARGET"] = df["TARGET"].to_numpy()
+    scores["RISK_BAND"] = risk_band(pd_values)
+    return scores
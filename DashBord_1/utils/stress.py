@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+# affordability stress thresholds from the Financial page
+LTI_CAP = 6.0
+DTI_CAP = 0.35
+# max scenario x applicant cells materialised at once (bounds memory)
+CELLS_PER_CHUNK = 1 << 24
+
+
+# -------------------------
+# Scenarios
+# -------------------------
+def scenario_grid(income_shocks, annuity_shocks, credit_shocks=(0.0,)):
+    """All combinations of relative shocks, e.g. income -0.2 (−20%), annuity +0.1.
+
+    A rate rise enters as an annuity shock. Returns an (S, 3) array of
+    multipliers for AMT_INCOME_TOTAL, AMT_ANNUITY and AMT_CREDIT.
+    """
+    grid = np.array(np.meshgrid(income_shocks, annuity_shocks, credit_shocks, indexing="ij"))
+    return 1.0 + grid.reshape(3, -1).T
+
+
+# -------------------------
+# Engine
+# -------------------------
+def run_scenarios(income, annuity, credit, segments, shocks, lti_cap=LTI_CAP, dti_cap=DTI_CAP,
+                  cells_per_chunk=CELLS_PER_CHUNK):
+    """Threshold breaches and exposure for every (scenario, segment).
+
+    Under shock (i, a, c) an applicant breaches DTI when
+    annuity*a / (income*i) > dti_cap, i.e. base DTI > dti_cap * i / a, so
+    every scenario reduces to one threshold per ratio. Single-ratio breach
+    counts then come from a binary search in each segment's sorted ratios.
+    The joint "LTI or DTI" breach and its exposure need the pair, so they
+    use one broadcast comparison of an (S, m) block. Applicants are sorted
+    by segment and processed in chunks of m rows, with S * m kept under
+    `cells_per_chunk`. Returns a long DataFrame with one row per scenario
+    and segment.
+    """
+    income = np.asarray(income, dtype="float64")
+    dti = np.asarray(annuity, dtype="float64") / income
+    lti = np.asarray(credit, dtype="float64") / income
+    credit = np.asarray(credit, dtype="float32")
+    codes, levels = pd.factorize(pd.Series(segments), sort=True)
+    ok = (codes >= 0) & np.isfinite(dti) & np.isfinite(lti)
+    order = np.argsort(codes[ok], kind="stable")
+    dti, lti, credit, codes = dti[ok][order], lti[ok][order], credit[ok][order], codes[ok][order]
+
+    shocks = np.asarray(shocks, dtype="float64")
+    S, G = len(shocks), len(levels)
+    dti_thr = dti_cap * shocks[:, 0] / shocks[:, 1]
+    lti_thr = lti_cap * shocks[:, 0] / shocks[:, 2]
+
+    n_seg = np.bincount(codes, minlength=G)
+    bounds = np.concatenate(([0], np.cumsum(n_seg)))
+    lti_hits = np.zeros((S, G))
+    dti_hits = np.zeros((S, G))
+    any_hits = np.zeros((S, G))
+    any_credit = np.zeros((S, G))
+
+    # single-ratio breaches: count of ratio > threshold in each sorted segment
+    for g in range(G):
+        seg_lti = np.sort(lti[bounds[g]:bounds[g + 1]])
+        seg_dti = np.sort(dti[bounds[g]:bounds[g + 1]])
+        lti_hits[:, g] = n_seg[g] - np.searchsorted(seg_lti, lti_thr, side="right")
+        dti_hits[:, g] = n_seg[g] - np.searchsorted(seg_dti, dti_thr, side="right")
+
+    # joint breach + exposure: broadcast (S, m) blocks, reduced per segment slice
+    step = max(1, cells_per_chunk // max(S, 1))
+    weights = np.column_stack((np.ones(len(credit), dtype="float32"), credit))
+    for g in range(G):
+        for start in range(bounds[g], bounds[g + 1], step):
+            sl = slice(start, min(start + step, bounds[g + 1]))
+            breach = (lti[None, sl] > lti_thr[:, None]) | (dti[None, sl] > dti_thr[:, None])
+            totals = breach.view(np.uint8).astype("float32") @ weights[sl]
+            any_hits[:, g] += totals[:, 0]
+            any_credit[:, g] += totals[:, 1]
+
+    n_seg = n_seg.astype("float64")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = pd.DataFrame({
+            "scenario": np.repeat(np.arange(S), G),
+            "income_shock": np.repeat(shocks[:, 0] - 1, G),
+            "annuity_shock": np.repeat(shocks[:, 1] - 1, G),
+            "credit_shock": np.repeat(shocks[:, 2] - 1, G),
+            "segment": np.tile(np.asarray(levels, dtype=object), S),
+            "applicants": np.tile(n_seg, S),
+            "lti_breach_pct": (lti_hits / n_seg).ravel() * 100,
+            "dti_breach_pct": (dti_hits / n_seg).ravel() * 100,
+            "any_breach_pct": (any_hits / n_seg).ravel() * 100,
+            # stressed credit amount of the applicants breaching either cap
+            "exposure_at_breach": (any_credit * shocks[:, 2:3]).ravel(),
+        })
+    return out
+
+
+def portfolio_totals(results):
+    """Collapse the per-segment rows into one row per scenario."""
+    agg = results.assign(
+        lti=results["lti_breach_pct"] * results["applicants"],
+        dti=results["dti_breach_pct"] * results["applicants"],
+        any=results["any_breach_pct"] * results["applicants"],
+    ).groupby(["scenario", "income_shock", "annuity_shock", "credit_shock"], as_index=False)[
+        ["applicants", "lti", "dti", "any", "exposure_at_breach"]
+    ].sum()
+    for col in ("lti", "dti", "any"):
+        agg[f"{col}_breach_pct"] = agg.pop(col) / agg["applicants"]
+    return agg
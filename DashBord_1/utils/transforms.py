@@ -0,0 +1,86 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+# -------------------------
+# Outlier handling (winsorize top/bottom 1% for numerics)
+# -------------------------
+def winsorize_numeric(df, cols, lower=0.01, upper=0.99):
+    """Clip every column in `cols` to its own [lower, upper] quantiles.
+
+    All quantiles come from one np.nanquantile call over the numeric block and
+    the clip is broadcast over the whole matrix in place. Matches
+    `series.quantile([lower, upper])` + `np.clip` applied column by column
+    (linear interpolation, NaNs skipped and kept; an int column stays int
+    only when both of its bounds are whole numbers, as pandas does).
+    """
+    cols = list(cols)
+    if not cols:
+        return df
+    block = df[cols].to_numpy(dtype="float64", copy=True)
+    with warnings.catch_warnings():
+        # all-NaN columns give NaN bounds, which leave the column untouched
+        warnings.simplefilter("ignore", RuntimeWarning)
+        bounds = np.nanquantile(block, [lower, upper], axis=0)
+    lo = np.where(np.isnan(bounds[0]), -np.inf, bounds[0])
+    hi = np.where(np.isnan(bounds[1]), np.inf, bounds[1])
+    np.clip(block, lo, hi, out=block)
+
+    clipped = pd.DataFrame(block, index=df.index, columns=cols)
+    whole_bounds = (bounds == np.round(bounds)).all(axis=0)
+    for j, col in enumerate(cols):
+        dtype = df[col].dtype
+        if dtype.kind in "iu" and whole_bounds[j]:
+            clipped[col] = clipped[col].astype(dtype)
+    df[cols] = clipped
+    return df
+
+
+# -------------------------
+# Standardize categories (merge rare categories under "Other")
+# -------------------------
+def merge_rare_codes(codes, n_categories, threshold=0.01):
+    """Return an integer remap table sending rare category codes to -2.
+
+    `codes` are pandas category codes (-1 = missing). A level is rare when
+    its share of the non-missing rows is strictly below `threshold`, the same
+    rule as `value_counts(normalize=True) < threshold`.
+    """
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=n_categories)
+    total = valid.sum()
+    rare = (counts / total < threshold) if total else np.zeros(n_categories, dtype=bool)
+    remap = np.full(n_categories, -2, dtype=np.intp)
+    remap[~rare] = np.arange((~rare).sum())
+    return remap, rare
+
+
+def merge_rare_categories(df, cols, threshold=0.01, other="Other"):
+    """Merge levels with share < `threshold` into `other`, column by column.
+
+    Works on category codes: each column is factorised once, rare codes are
+    remapped with a small integer lookup table and the strings are only
+    rebuilt at the end, so the output is identical to
+    `series.replace(rare_levels, other)`.
+    """
+    for col in cols:
+        series = df[col]
+        cat = pd.Categorical(series)
+        codes = cat.codes
+        remap, rare = merge_rare_codes(codes, len(cat.categories), threshold)
+        if not rare.any():
+            continue
+        kept = cat.categories[~rare]
+        if other in kept:
+            other_code = kept.get_loc(other)
+            categories = kept
+        else:
+            other_code = len(kept)
+            categories = kept.append(pd.Index([other]))
+        remap[rare] = other_code
+        new_codes = np.where(codes >= 0, remap[codes], -1)
+        merged = pd.Categorical.from_codes(new_codes, categories)
+        df[col] = pd.Series(merged, index=series.index, name=col).astype(series.dtype)
+    return df
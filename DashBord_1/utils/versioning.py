@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+MANIFEST_PATH = "data_manifest.json"
+CACHE_DIR = ".artifact_cache"
+HASH_CHUNK = 1 << 20
+# params variants kept per artifact name (least recently used evicted first)
+MAX_ENTRIES_PER_NAME = 16
+
+
+# -------------------------
+# Fingerprints & manifest
+# -------------------------
+def content_hash(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(file_path):
+    """File stat + content hash; `version` is what downstream caches key on."""
+    stat = os.stat(file_path)
+    sha = content_hash(file_path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha,
+        "version": sha[:16],
+    }
+
+
+def read_manifest(manifest_path=MANIFEST_PATH):
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _atomic_write(path, write, mode="w"):
+    # write to a unique temp file next to `path`, then swap it in: concurrent
+    # page loads never see a half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_manifest(file_paths, manifest_path=MANIFEST_PATH):
+    """Fingerprint `file_paths` and record them; called at the end of preprocessing."""
+    manifest = read_manifest(manifest_path)
+    for file_path in file_paths:
+        manifest[os.path.basename(file_path)] = fingerprint(file_path)
+    _atomic_write(manifest_path, lambda f: json.dump(manifest, f, indent=2, sort_keys=True))
+    return manifest
+
+
+def dataset_version(file_path, manifest_path=MANIFEST_PATH):
+    """Version of `file_path`, trusting the manifest while size/mtime still match.
+
+    The content hash is only recomputed (and the manifest refreshed) when the
+    file was touched outside preprocessing, so a normal page load costs one stat.
+    """
+    name = os.path.basename(file_path)
+    entry = read_manifest(manifest_path).get(name)
+    stat = os.stat(file_path)
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["version"]
+    return write_manifest([file_path], manifest_path)[name]["version"]
+
+
+# -------------------------
+# On-disk artifact cache
+# -------------------------
+def _params_key(params):
+    return hashlib.sha256(repr(params).encode()).hexdigest()[:12]
+
+
+def _artifact_path(name, version, params_key, cache_dir):
+    return os.path.join(cache_dir, f"{name}--{version}--{params_key}.pkl")
+
+
+def _evict(name, version, cache_dir, keep):
+    # drop entries of `name` built from another version, then all but the
+    # `keep` most recently used variants (hits refresh an entry's mtime)
+    current = []
+    for entry in os.listdir(cache_dir):
+        parts = entry.split("--")
+        if len(parts) != 3 or parts[0] != name or not entry.endswith(".pkl"):
+            continue
+        path = os.path.join(cache_dir, entry)
+        try:
+            if parts[1] != version:
+                os.remove(path)
+            else:
+                current.append((os.stat(path).st_mtime_ns, path))
+        except FileNotFoundError:  # evicted concurrently
+            pass
+    for _, path in sorted(current, reverse=True)[keep:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def cached_artifact(name, version, compute, *params, cache_dir=CACHE_DIR, max_entries=MAX_ENTRIES_PER_NAME):
+    """Load artifact `name` for data `version` from disk, computing it on a miss.
+
+    `version` is the dataset version (or a tuple of versions) the artifact
+    depends on, so a data refresh misses exactly the artifacts built from
+    that data. `params` separate variants of one artifact (e.g. selected
+    columns); at most `max_entries` variants per name are kept, least
+    recently used first out. Entries for older versions are deleted on
+    write, and an entry that fails to load for any reason (truncated,
+    pickled by other pandas/numpy versions) is treated as a miss.
+    """
+    if isinstance(version, (tuple, list)):
+        version = hashlib.sha256("|".join(version).encode()).hexdigest()[:16]
+    params_key = _params_key(params)
+    path = _artifact_path(name, version, params_key, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+        os.utime(path)
+        return value
+    except Exception:
+        pass
+
+    value = compute()
+    os.makedirs(cache_dir, exist_ok=True)
+    _atomic_write(path, lambda f: pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL), mode="wb")
+    _evict(name, version, cache_dir, max_entries)
+    return value
+
+
+def cached_figure(name, version, build, *params, dpi=100, cache_dir=CACHE_DIR):
+    """PNG bytes of the matplotlib figure returned by `build()`, cached like an artifact."""
+    def render():
+        import io
+
+        import matplotlib.pyplot as plt
+
+        fig = build()
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+        plt.close(fig)
+        return buf.getvalue()
+
+    return cached_artifact(f"fig-{name}", version, render, *params, cache_dir=cache_dir)